@@ -10,19 +10,27 @@ To run the website locally:
 Then open http://localhost:5000 in your browser.
 """
 
-from flask import Flask, render_template, jsonify, abort
+import hashlib
+import os
+from functools import lru_cache
+
+import orjson
+from flask import Flask, render_template, stream_template, abort, request, Response
+from flask.json.provider import DefaultJSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
+from jinja2 import FileSystemBytecodeCache
 from pace_analyzer import (
-    calculate_rankings,
-    get_meeting_breakdown,
+    get_rankings,
+    get_meeting_breakdown_cached,
     get_session_pecking_order,
     get_meeting_pecking_order,
 )
 from database import (
     get_statistics,
     initialize_database,
-    get_meeting_by_key,
-    get_sessions_for_meeting,
-    get_session_by_meeting_and_type,
+    get_session_detail_bundle,
+    load_memory_replica,
 )
 
 # Create the Flask application
@@ -30,6 +38,93 @@ from database import (
 app = Flask(__name__)
 
 
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson, a much faster C-based serializer
+    than the stdlib json module Flask uses by default.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app.json = ORJSONProvider(app)
+
+# Cache compiled templates on disk so they survive server restarts.
+# Without this, Jinja re-parses and re-compiles each template source the
+# first time it's rendered in every new process.
+_JINJA_CACHE_DIR = os.path.join(os.path.dirname(__file__), '.jinja_cache')
+os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=_JINJA_CACHE_DIR)
+
+# Debug mode is opt-in via the FLASK_DEBUG environment variable.
+# Debug mode turns on the auto-reloader AND makes Jinja stat every
+# template file on every render to check for changes - useful while
+# editing templates, pure overhead in production where they never change.
+DEBUG_MODE = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes')
+
+app.config.update(
+    DEBUG=DEBUG_MODE,
+    TEMPLATES_AUTO_RELOAD=DEBUG_MODE,
+)
+app.jinja_env.auto_reload = DEBUG_MODE
+
+# Response cache for the ranking pages.
+#
+# The rankings only change when the data collector ingests a new meeting,
+# but calculate_rankings() re-reads every lap in the database. Caching the
+# computed results means repeat page views are served from memory instead
+# of re-running the aggregation on every request.
+#
+# The collector runs as a separate process, so we rely on the timeout
+# (rather than explicit invalidation) to pick up freshly ingested data.
+cache = Cache(app, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': 300,
+})
+
+# Compress responses (gzip/brotli) when the browser supports it.
+# The ranking tables are very repetitive HTML, so this typically cuts
+# the bytes on the wire by 70-80%.
+Compress(app)
+
+
+@app.after_request
+def add_cache_headers(response):
+    """
+    Lets browsers and CDNs reuse HTML pages for a few minutes.
+
+    The pages only change when the collector ingests new data, so
+    re-downloading them on every visit is wasted work. API responses set
+    their own headers, and this only applies to successful GETs.
+    """
+    if (
+        request.method == 'GET'
+        and response.status_code == 200
+        and 'Cache-Control' not in response.headers
+        and response.mimetype == 'text/html'
+    ):
+        response.headers['Cache-Control'] = 'public, max-age=300'
+    return response
+
+# Optionally serve all reads from an in-memory copy of the database.
+# A season of lap data easily fits in RAM, so this removes disk I/O from
+# every page view. The copy is made once at startup, so fresh data from
+# the collector only shows up after a restart - hence opt-in via env var.
+if os.environ.get('F1_IN_MEMORY_DB', '').lower() in ('1', 'true', 'yes'):
+    initialize_database()
+    load_memory_replica()
+
+# Memoized versions of the per-meeting/per-session calculations.
+# These are keyed by their integer argument, so each race weekend and
+# session only pays the full calculation cost once per timeout window.
+cached_meeting_pecking_order = cache.memoize(timeout=300)(get_meeting_pecking_order)
+cached_session_pecking_order = cache.memoize(timeout=300)(get_session_pecking_order)
+
+
 # =============================================================================
 # SESSION SLUG MAPPING
 # =============================================================================
@@ -55,6 +150,7 @@ SESSION_NAME_TO_SLUG = {v: k for k, v in SESSION_SLUGS.items()}
 # =============================================================================
 
 @app.route('/')
+@cache.cached(timeout=300)
 def home():
     """
     The main homepage that shows the pecking order rankings.
@@ -62,14 +158,14 @@ def home():
     When someone visits http://localhost:5000/, this function runs
     and returns the HTML page to display.
     """
-    # Calculate the current rankings
-    driver_rankings, team_rankings = calculate_rankings()
+    # Load the current rankings (materialized by the collector when possible)
+    driver_rankings, team_rankings = get_rankings()
 
     # Get database statistics
     stats = get_statistics()
 
     # Get breakdown by race weekend
-    meetings = get_meeting_breakdown()
+    meetings = get_meeting_breakdown_cached()
 
     # Render the HTML template with our data
     # The template file is in templates/index.html
@@ -82,6 +178,45 @@ def home():
     )
 
 
+# The API endpoints serve the same bytes to every caller between data
+# refreshes, so we serialize once, remember the bytes plus a hash of them
+# (the ETag), and let clients that already hold the current version skip
+# the body transfer entirely with a 304 response.
+
+@cache.memoize(timeout=300)
+def _rankings_json():
+    """Returns (body_bytes, etag) for the rankings API payload."""
+    driver_rankings, team_rankings = get_rankings()
+    body = orjson.dumps({
+        'drivers': driver_rankings,
+        'teams': team_rankings,
+    })
+    return body, hashlib.md5(body).hexdigest()
+
+
+@cache.memoize(timeout=300)
+def _stats_json():
+    """Returns (body_bytes, etag) for the stats API payload."""
+    body = orjson.dumps(get_statistics())
+    return body, hashlib.md5(body).hexdigest()
+
+
+def _json_response(body, etag):
+    """
+    Builds a JSON response with caching headers.
+
+    If the client sent an If-None-Match header matching our ETag, it
+    already has the current payload and we answer 304 with no body.
+    """
+    if request.if_none_match.contains(etag):
+        return Response(status=304, headers={'ETag': etag})
+
+    return Response(body, mimetype='application/json', headers={
+        'ETag': etag,
+        'Cache-Control': 'public, max-age=300',
+    })
+
+
 @app.route('/api/rankings')
 def api_rankings():
     """
@@ -92,12 +227,7 @@ def api_rankings():
 
     Access at: http://localhost:5000/api/rankings
     """
-    driver_rankings, team_rankings = calculate_rankings()
-
-    return jsonify({
-        'drivers': driver_rankings,
-        'teams': team_rankings,
-    })
+    return _json_response(*_rankings_json())
 
 
 @app.route('/api/stats')
@@ -107,8 +237,7 @@ def api_stats():
 
     Access at: http://localhost:5000/api/stats
     """
-    stats = get_statistics()
-    return jsonify(stats)
+    return _json_response(*_stats_json())
 
 
 @app.route('/methodology')
@@ -126,19 +255,15 @@ def race_detail(meeting_key):
 
     Shows the overall weekend pecking order and session preview cards.
     """
-    meeting_data = get_meeting_pecking_order(meeting_key)
+    meeting_data = cached_meeting_pecking_order(meeting_key)
 
     if not meeting_data:
         abort(404)
 
-    # Add slugs to sessions for URL building
-    for session in meeting_data.get('sessions', []):
-        session['slug'] = SESSION_NAME_TO_SLUG.get(session['session_name'], '')
-
-    for summary in meeting_data.get('session_summaries', []):
-        summary['slug'] = SESSION_NAME_TO_SLUG.get(summary['session_name'], '')
-
-    return render_template(
+    # stream_template sends the page in chunks as Jinja renders it, so
+    # the browser starts receiving the table while the rest of the page
+    # is still being generated (and we never hold the full HTML in memory)
+    return stream_template(
         'race_detail.html',
         meeting=meeting_data['meeting'],
         overall_rankings=meeting_data['overall_rankings'],
@@ -154,34 +279,24 @@ def session_detail(meeting_key, session_slug):
 
     Shows detailed pecking order for a specific session with sectors, tires, etc.
     """
-    # Convert slug to session name
+    # Convert slug to session name - a bad slug is rejected before any
+    # database work happens
     session_name = SESSION_SLUGS.get(session_slug)
     if not session_name:
         abort(404)
 
-    # Get meeting info
-    meeting = get_meeting_by_key(meeting_key)
-    if not meeting:
-        abort(404)
-
-    # Get the specific session
-    session = get_session_by_meeting_and_type(meeting_key, session_name)
-    if not session:
+    # One database trip for the meeting, the requested session, and the
+    # session list used by the tab bar
+    meeting, session, all_sessions = get_session_detail_bundle(meeting_key, session_name)
+    if not meeting or not session:
         abort(404)
 
     # Get session pecking order
-    session_data = get_session_pecking_order(session['session_key'])
+    session_data = cached_session_pecking_order(session['session_key'])
     if not session_data:
         abort(404)
 
-    # Get all sessions for this meeting (for tab navigation)
-    all_sessions = get_sessions_for_meeting(meeting_key)
-
-    # Add slugs to sessions
-    for s in all_sessions:
-        s['slug'] = SESSION_NAME_TO_SLUG.get(s['session_name'], '')
-
-    return render_template(
+    return stream_template(
         'session_detail.html',
         meeting=meeting,
         session=session_data['session'],
@@ -197,7 +312,26 @@ def session_detail(meeting_key, session_slug):
 # TEMPLATE FILTERS
 # =============================================================================
 
+# The filters below run once per table cell, so ranking pages call them
+# hundreds of times per render - usually with the same few values (gaps,
+# sector times, speeds repeat across sessions). lru_cache turns repeat
+# calls into a dictionary lookup instead of re-running the formatting.
+
+@app.template_filter('slug')
+def session_slug(session_name):
+    """
+    Maps a session name (e.g., "Practice 1") to its URL slug (e.g., "fp1").
+
+    Usage in templates: {{ session.session_name | slug }}
+
+    Doing this in the template means the route handlers don't have to
+    mutate the (cached) session dictionaries on every request.
+    """
+    return SESSION_NAME_TO_SLUG.get(session_name, '')
+
+
 @app.template_filter('format_gap')
+@lru_cache(maxsize=4096)
 def format_gap(value):
     """
     Custom filter to format gap times nicely.
@@ -213,6 +347,7 @@ def format_gap(value):
 
 
 @app.template_filter('format_pace')
+@lru_cache(maxsize=4096)
 def format_pace(value):
     """
     Custom filter to format pace times as mm:ss.xxx
@@ -232,6 +367,7 @@ def format_pace(value):
 
 
 @app.template_filter('format_sector')
+@lru_cache(maxsize=4096)
 def format_sector(value):
     """
     Custom filter to format sector times as ss.xxx
@@ -245,6 +381,7 @@ def format_sector(value):
 
 
 @app.template_filter('format_speed')
+@lru_cache(maxsize=4096)
 def format_speed(value):
     """
     Custom filter to format speed trap values.
@@ -276,6 +413,6 @@ if __name__ == '__main__':
     print("=" * 50 + "\n")
 
     # Run the Flask development server
-    # debug=True means the server will auto-reload when you change code
-    # and show detailed error messages
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    # Set FLASK_DEBUG=1 to auto-reload when you change code and show
+    # detailed error messages (don't use debug mode in production!)
+    app.run(debug=DEBUG_MODE, host='0.0.0.0', port=5001)
@@ -13,8 +13,12 @@ The main function fetch_recent_data() will:
 5. Mark invalid laps (outliers, pit laps, etc.)
 """
 
+import bisect
+import orjson
 import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 
@@ -31,13 +35,22 @@ from config import (
 )
 from database import (
     initialize_database,
+    get_db_connection,
+    transaction,
+    drop_lap_indexes,
+    recreate_indexes,
     insert_meeting,
-    insert_session,
-    insert_driver,
-    insert_stint,
+    bulk_insert_sessions,
+    bulk_insert_drivers,
     bulk_insert_laps,
+    bulk_insert_stints,
     get_statistics,
     meeting_exists,
+    session_has_laps,
+)
+from pace_analyzer import (
+    ensure_materialized_rankings,
+    refresh_materialized_rankings,
 )
 
 
@@ -45,6 +58,20 @@ from database import (
 # API REQUEST HELPER
 # =============================================================================
 
+# A shared Session reuses the same TCP+TLS connection for every API call
+# instead of doing a fresh handshake each time. An ingest makes hundreds
+# of requests to the same host, so this saves a round trip per call.
+_SESSION = requests.Session()
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=3,
+))
+
+# Makes sure concurrent fetches still respect the global rate limit
+_RATE_LIMIT_LOCK = threading.Lock()
+
+
 def make_api_request(endpoint: str, params: Optional[Dict] = None) -> Optional[List[Dict]]:
     """
     Makes a request to the OpenF1 API.
@@ -65,18 +92,23 @@ def make_api_request(endpoint: str, params: Optional[Dict] = None) -> Optional[L
     # Build the full URL
     url = f"{OPENF1_API_BASE_URL}{endpoint}"
 
-    # Be respectful - wait before making the request
-    time.sleep(API_REQUEST_DELAY)
+    # Be respectful - wait before making the request.
+    # The lock serializes the delay (not the requests themselves), so even
+    # when several threads fetch concurrently, request starts stay spaced
+    # out by API_REQUEST_DELAY.
+    with _RATE_LIMIT_LOCK:
+        time.sleep(API_REQUEST_DELAY)
 
     try:
-        # Make the HTTP GET request
-        response = requests.get(url, params=params, timeout=API_TIMEOUT)
+        # Make the HTTP GET request (on the shared, pooled session)
+        response = _SESSION.get(url, params=params, timeout=API_TIMEOUT)
 
         # Check if the request was successful (status code 200)
         response.raise_for_status()
 
-        # Parse the JSON response
-        data = response.json()
+        # Parse the JSON response (orjson parses the raw bytes directly
+        # and is several times faster than the stdlib json module)
+        data = orjson.loads(response.content)
 
         return data
 
@@ -92,7 +124,7 @@ def make_api_request(endpoint: str, params: Optional[Dict] = None) -> Optional[L
         print(f"    ERROR: Request failed for {endpoint}: {e}")
         return None
 
-    except ValueError as e:
+    except (ValueError, orjson.JSONDecodeError) as e:
         print(f"    ERROR: Could not parse JSON from {endpoint}: {e}")
         return None
 
@@ -205,6 +237,98 @@ def fetch_drivers(session_key: int) -> List[Dict]:
     return data
 
 
+def fetch_session_payloads(sessions: List[Dict]) -> Dict[int, tuple]:
+    """
+    Fetches drivers, laps, and stints for every session concurrently.
+
+    All of these API calls are independent, so instead of waiting for
+    them one session at a time, we issue them together on a small thread
+    pool and let the network waits overlap. The pool is capped at 5
+    workers - the rate limiter spaces out request starts anyway, and
+    hammering the API with more parallel requests doesn't make it faster.
+
+    Args:
+        sessions: List of session dictionaries from the API
+
+    Returns:
+        Dict mapping session_key to a (drivers, laps, stints) tuple
+    """
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = {}
+        for session in sessions:
+            session_key = session.get('session_key')
+            futures[session_key] = (
+                executor.submit(fetch_drivers, session_key),
+                executor.submit(fetch_laps, session_key),
+                executor.submit(fetch_stints, session_key),
+            )
+
+        return {
+            session_key: (drivers.result(), laps.result(), stints.result())
+            for session_key, (drivers, laps, stints) in futures.items()
+        }
+
+
+def _session_is_over(session: Dict) -> bool:
+    """
+    Returns True if a session's scheduled end time is in the past.
+
+    Sessions with a missing or unparseable end date are treated as not
+    over, so they always get (re-)fetched.
+    """
+    date_end = session.get('date_end')
+    if not date_end:
+        return False
+
+    try:
+        end = datetime.fromisoformat(date_end)
+    except ValueError:
+        return False
+
+    # Compare in the same timezone the API reported (or naive local time
+    # if none was given)
+    now = datetime.now(end.tzinfo)
+    return end < now
+
+
+def fetch_meeting_payload(meeting_key: int, force_refresh: bool = False) -> tuple:
+    """
+    Fetches everything one meeting needs from the API: its session list
+    plus every session's drivers, laps, and stints.
+
+    Bundling the whole download into one function lets fetch_recent_data
+    pull the NEXT meeting in a background thread while the current one is
+    being merged and written to the database, so the network and the
+    database never wait on each other.
+
+    Sessions that have finished and already have laps stored are not
+    re-downloaded (a completed session's data never changes). This is
+    what keeps re-runs cheap mid-weekend: the current meeting is always
+    revisited, but only its new or in-progress sessions cost API calls.
+
+    Args:
+        meeting_key: The unique identifier for the race weekend
+        force_refresh: Re-download sessions even if already ingested
+
+    Returns:
+        Tuple of (sessions, payloads) where payloads maps session_key to
+        (drivers, laps, stints) - see fetch_session_payloads. Skipped
+        sessions have no payload entry.
+    """
+    sessions = fetch_sessions(meeting_key)
+
+    if force_refresh:
+        sessions_to_fetch = sessions
+    else:
+        sessions_to_fetch = [
+            session for session in sessions
+            if not (_session_is_over(session)
+                    and session_has_laps(session.get('session_key')))
+        ]
+
+    return sessions, fetch_session_payloads(sessions_to_fetch)
+
+
 # =============================================================================
 # DATA MERGING FUNCTIONS
 # =============================================================================
@@ -223,14 +347,22 @@ def merge_laps_with_stints(laps: List[Dict], stints: List[Dict]) -> List[Dict]:
     Returns:
         List of lap records with tire compound and age added
     """
-    # Create a lookup structure for stints by driver
-    # This makes it faster to find which stint a lap belongs to
+    # Group stints by driver and sort each driver's stints by lap_start.
+    # Stints are disjoint, contiguous lap ranges, so once they're sorted we
+    # can find the stint for any lap with a binary search instead of
+    # scanning every stint for every lap.
     driver_stints = {}
     for stint in stints:
-        driver_num = stint.get('driver_number')
-        if driver_num not in driver_stints:
-            driver_stints[driver_num] = []
-        driver_stints[driver_num].append(stint)
+        driver_stints.setdefault(stint.get('driver_number'), []).append(stint)
+
+    # Parallel list of each driver's stint start laps (for bisect).
+    # The sort happens once per driver, not once per lap - and drivers
+    # with a single stint (common outside races) skip it entirely.
+    driver_stint_starts = {}
+    for driver_num, stint_list in driver_stints.items():
+        if len(stint_list) > 1:
+            stint_list.sort(key=lambda s: s.get('lap_start') or 0)
+        driver_stint_starts[driver_num] = [s.get('lap_start') or 0 for s in stint_list]
 
     # Go through each lap and add tire information
     for lap in laps:
@@ -241,28 +373,34 @@ def merge_laps_with_stints(laps: List[Dict], stints: List[Dict]) -> List[Dict]:
         lap['compound'] = None
         lap['tire_age'] = None
 
-        # Find the stint this lap belongs to
-        if driver_num in driver_stints:
-            for stint in driver_stints[driver_num]:
-                lap_start = stint.get('lap_start', 0)
-                lap_end = stint.get('lap_end', 999)  # Use high number if not set
+        stint_list = driver_stints.get(driver_num)
+        if not stint_list or lap_num is None:
+            continue
 
-                # Check if this lap falls within this stint
-                if lap_start <= lap_num <= lap_end:
-                    lap['compound'] = stint.get('compound')
+        # Binary search: the stint this lap belongs to is the rightmost
+        # one whose lap_start is <= lap_num
+        idx = bisect.bisect_right(driver_stint_starts[driver_num], lap_num) - 1
+        if idx < 0:
+            continue  # Lap happened before the first recorded stint
 
-                    # Calculate tire age for this lap
-                    # tire_age = laps since stint started + initial tire age
-                    initial_age = stint.get('tyre_age_at_start', 0)
-                    laps_in_stint = lap_num - lap_start
-                    lap['tire_age'] = initial_age + laps_in_stint
+        stint = stint_list[idx]
+        lap_start = stint.get('lap_start') or 0
+        lap_end = stint.get('lap_end') or 999  # Use high number if not set
 
-                    break  # Found the right stint, stop looking
+        # Check if this lap falls within this stint
+        if lap_start <= lap_num <= lap_end:
+            lap['compound'] = stint.get('compound')
+
+            # Calculate tire age for this lap
+            # tire_age = laps since stint started + initial tire age
+            initial_age = stint.get('tyre_age_at_start', 0)
+            laps_in_stint = lap_num - lap_start
+            lap['tire_age'] = initial_age + laps_in_stint
 
     return laps
 
 
-def mark_invalid_laps(laps: List[Dict], session_type: str) -> List[Dict]:
+def mark_invalid_laps(laps: List[Dict], session_type: str) -> tuple:
     """
     Marks laps that shouldn't be used for pace analysis.
 
@@ -277,28 +415,41 @@ def mark_invalid_laps(laps: List[Dict], session_type: str) -> List[Dict]:
         session_type: Type of session (Practice, Qualifying, Race)
 
     Returns:
-        List of lap records with is_valid_for_ranking set
+        Tuple of (laps, valid_count): the lap records with
+        is_valid_for_ranking set, and how many of them are valid.
+        Counting happens inside the marking loop, so the caller doesn't
+        need a second pass over the laps just for the log line.
     """
     if not laps:
-        return laps
+        return laps, 0
 
-    # Calculate the average lap time for this session (excluding obvious outliers)
-    valid_times = []
-    for lap in laps:
-        lap_time = lap.get('lap_duration')
-        if lap_time and MIN_VALID_LAP_TIME < lap_time < MAX_VALID_LAP_TIME:
-            valid_times.append(lap_time)
+    # Calculate the average lap time for this session (excluding obvious
+    # outliers). List comprehensions keep these filter passes in C
+    # instead of a Python-level append loop.
+    all_times = [lap.get('lap_duration') for lap in laps]
+    valid_times = [
+        lap_time for lap_time in all_times
+        if lap_time and MIN_VALID_LAP_TIME < lap_time < MAX_VALID_LAP_TIME
+    ]
 
     if not valid_times:
         # No valid times found, mark all as invalid
         for lap in laps:
             lap['is_valid_for_ranking'] = False
-        return laps
+        return laps, 0
 
-    # Calculate average lap time
+    # Calculate the comparison thresholds once, outside the lap loop.
+    # The outlier and qualifying cutoffs are the same for every lap, so
+    # there's no need to recompute the average/minimum per lap.
     average_lap_time = sum(valid_times) / len(valid_times)
+    outlier_cutoff = average_lap_time * LAP_TIME_OUTLIER_THRESHOLD
+
+    # In quali, a valid hot lap should be within 5% of the best time
+    # (many quali laps are slow out-laps or aborted laps)
+    quali_cutoff = min(valid_times) * 1.05
 
-    # Mark each lap as valid or invalid
+    # Mark each lap as valid or invalid, counting the valid ones as we go
+    valid_count = 0
     for lap in laps:
         lap_time = lap.get('lap_duration')
         is_pit_out = lap.get('is_pit_out_lap', False)
@@ -322,26 +473,27 @@ def mark_invalid_laps(laps: List[Dict], session_type: str) -> List[Dict]:
             continue
 
         # Mark invalid: Lap time is way slower than average (probably yellow flag, etc.)
-        if lap_time > average_lap_time * LAP_TIME_OUTLIER_THRESHOLD:
+        if lap_time > outlier_cutoff:
             lap['is_valid_for_ranking'] = False
             continue
 
         # For qualifying sessions, also check if it's a fast enough lap
-        # (Many quali laps are slow out-laps or aborted laps)
-        if session_type == "Qualifying":
-            # In quali, a valid hot lap should be within 5% of the best time
-            best_time = min(valid_times)
-            if lap_time > best_time * 1.05:
-                lap['is_valid_for_ranking'] = False
+        if session_type == "Qualifying" and lap_time > quali_cutoff:
+            lap['is_valid_for_ranking'] = False
+            continue
 
-    return laps
+        # The lap survived every check
+        valid_count += 1
+
+    return laps, valid_count
 
 
 # =============================================================================
 # MAIN DATA COLLECTION FUNCTION
 # =============================================================================
 
-def fetch_recent_data(year: int = TARGET_YEAR, num_meetings: int = NUM_RECENT_MEETINGS):
+def fetch_recent_data(year: int = TARGET_YEAR, num_meetings: int = NUM_RECENT_MEETINGS,
+                      force_refresh: bool = False):
     """
     Main function that fetches data for recent race weekends and stores it.
 
@@ -350,9 +502,15 @@ def fetch_recent_data(year: int = TARGET_YEAR, num_meetings: int = NUM_RECENT_ME
     2. Takes the most recent N meetings
     3. For each meeting, fetches and stores all data
 
+    Meetings that are already in the database are skipped (past race
+    weekends never change), which makes re-runs near-instant. The most
+    recent meeting is always re-fetched since it may still be in
+    progress, and force_refresh=True re-fetches everything.
+
     Args:
         year: The F1 season year
         num_meetings: How many recent race weekends to fetch
+        force_refresh: Re-fetch meetings even if already ingested
     """
     print("=" * 60)
     print("F1 PECKING ORDER - DATA COLLECTOR")
@@ -389,79 +547,152 @@ def fetch_recent_data(year: int = TARGET_YEAR, num_meetings: int = NUM_RECENT_ME
     total_laps = 0
     all_drivers = set()
 
-    # Process each meeting
+    # Decide up front which meetings actually need fetching. Past race
+    # weekends never change, so meetings already in the database are
+    # skipped - except the most recent one, which may still be in
+    # progress when the collector runs. force_refresh re-fetches all.
+    meetings_to_process = []
     for i, meeting in enumerate(recent_meetings, 1):
-        meeting_name = meeting.get('meeting_name', 'Unknown')
-        meeting_key = meeting.get('meeting_key')
-
-        print(f"\n{'='*60}")
-        print(f"[{i}/{len(recent_meetings)}] Processing: {meeting_name}")
-        print("=" * 60)
-
-        # Store the meeting in our database
-        meeting['year'] = year
-        insert_meeting(meeting)
-
-        # Fetch all sessions for this meeting
-        print("\n  Fetching sessions...")
-        sessions = fetch_sessions(meeting_key)
-        print(f"  Found {len(sessions)} sessions")
-
-        # Process each session
-        for session in sessions:
-            session_name = session.get('session_name', 'Unknown')
-            session_key = session.get('session_key')
-            session_type = session.get('session_type', '')
-
-            print(f"\n  Processing session: {session_name}")
-
-            # Store the session
-            insert_session(session)
-            total_sessions += 1
-
-            # Fetch drivers for this session
-            print(f"    Fetching drivers...")
-            drivers = fetch_drivers(session_key)
-            print(f"    Found {len(drivers)} drivers")
-
-            # Store each driver
-            for driver in drivers:
-                insert_driver(driver, session_key)
-                all_drivers.add(driver.get('full_name'))
-
-            # Fetch laps for this session
-            print(f"    Fetching laps...")
-            laps = fetch_laps(session_key)
-            print(f"    Found {len(laps)} laps")
-
-            if not laps:
-                continue
-
-            # Fetch stint data (tire compounds)
-            print(f"    Fetching stint data...")
-            stints = fetch_stints(session_key)
-            print(f"    Found {len(stints)} stints")
-
-            # Store stints
-            for stint in stints:
-                insert_stint(stint, session_key)
-
-            # Merge lap data with stint data to add tire info
-            print(f"    Merging lap and stint data...")
-            laps = merge_laps_with_stints(laps, stints)
-
-            # Mark invalid laps (pit laps, outliers, etc.)
-            print(f"    Marking invalid laps...")
-            laps = mark_invalid_laps(laps, session_type)
-
-            # Count valid laps
-            valid_count = sum(1 for lap in laps if lap.get('is_valid_for_ranking'))
-            print(f"    Valid laps for ranking: {valid_count}/{len(laps)}")
-
-            # Store all laps in the database
-            print(f"    Storing laps in database...")
-            bulk_insert_laps(laps, session_key)
-            total_laps += len(laps)
+        if meeting_exists(meeting.get('meeting_key')) and not force_refresh and i > 1:
+            print(f"  Skipping {meeting.get('meeting_name', 'Unknown')} (already ingested)")
+            continue
+        meetings_to_process.append(meeting)
+
+    if not meetings_to_process:
+        print("\nAll requested meetings are already ingested - nothing to fetch.")
+    else:
+        # Drop the secondary indexes on the high-volume tables for the
+        # duration of the load. Inserting into an indexed table pays one
+        # B-tree update per index per row; rebuilding the indexes once at
+        # the end does the same work in a single sorted pass. (A run with
+        # nothing to ingest skips the drop/rebuild entirely.)
+        drop_lap_indexes()
+
+        # Process each meeting on one shared connection. Each meeting is
+        # written inside a single transaction, so SQLite syncs to disk
+        # once per race weekend instead of once per inserted row - and a
+        # crash mid-meeting leaves the database without a half-written
+        # weekend.
+        #
+        # The single-worker prefetcher downloads the NEXT meeting while
+        # the current one is being merged and written: downloading is
+        # pure network wait and writing is pure CPU/disk work, so
+        # overlapping the two stages hides one full download behind each
+        # meeting's write.
+        try:
+            with get_db_connection() as conn, \
+                    ThreadPoolExecutor(max_workers=1) as prefetcher:
+
+                next_payload = prefetcher.submit(
+                    fetch_meeting_payload,
+                    meetings_to_process[0].get('meeting_key'),
+                    force_refresh,
+                )
+
+                for i, meeting in enumerate(meetings_to_process, 1):
+                    meeting_name = meeting.get('meeting_name', 'Unknown')
+                    meeting_key = meeting.get('meeting_key')
+
+                    print(f"\n{'='*60}")
+                    print(f"[{i}/{len(meetings_to_process)}] Processing: {meeting_name}")
+                    print("=" * 60)
+
+                    # Wait for this meeting's download (started one
+                    # iteration ago, or just above for the first meeting)...
+                    sessions, payloads = next_payload.result()
+                    print(f"  Found {len(sessions)} sessions")
+
+                    # ...and immediately start downloading the next meeting
+                    # in the background while we process and store this one
+                    if i < len(meetings_to_process):
+                        next_payload = prefetcher.submit(
+                            fetch_meeting_payload,
+                            meetings_to_process[i].get('meeting_key'),
+                            force_refresh,
+                        )
+
+                    with transaction(conn):
+                        # Store the meeting and all of its sessions up
+                        # front - one batched statement instead of one
+                        # insert per session
+                        meeting['year'] = year
+                        insert_meeting(meeting, conn=conn)
+                        bulk_insert_sessions(sessions, conn=conn)
+                        total_sessions += len(sessions)
+
+                        # Process each session
+                        for session in sessions:
+                            session_name = session.get('session_name', 'Unknown')
+                            session_key = session.get('session_key')
+                            session_type = session.get('session_type', '')
+
+                            # Completed sessions we already have were not
+                            # re-downloaded; their stored data is left
+                            # untouched
+                            if session_key not in payloads:
+                                print(f"\n  Skipping session: {session_name} (already ingested)")
+                                continue
+
+                            # Buffer this session's status lines and emit
+                            # them with a single print at the end. Every
+                            # print is a write syscall (line-buffered on a
+                            # terminal), and several per session across a
+                            # season of ingests is measurable overhead in
+                            # the hot loop.
+                            status = [f"\n  Processing session: {session_name}"]
+
+                            # The data for this session was already fetched
+                            # above
+                            drivers, laps, stints = payloads[session_key]
+                            status.append(
+                                f"    Found {len(drivers)} drivers, "
+                                f"{len(laps)} laps, {len(stints)} stints"
+                            )
+
+                            # Store the session's drivers in one batch
+                            bulk_insert_drivers(drivers, session_key, conn=conn)
+                            all_drivers.update(driver.get('full_name') for driver in drivers)
+
+                            if not laps:
+                                print("\n".join(status))
+                                continue
+
+                            # Store stints
+                            bulk_insert_stints(stints, session_key, conn=conn)
+
+                            # Merge lap data with stint data to add tire info
+                            laps = merge_laps_with_stints(laps, stints)
+
+                            # Mark invalid laps (pit laps, outliers, etc.) -
+                            # the valid count comes back from the same pass
+                            laps, valid_count = mark_invalid_laps(laps, session_type)
+                            status.append(f"    Valid laps for ranking: {valid_count}/{len(laps)}")
+
+                            # Store all laps in the database
+                            bulk_insert_laps(laps, session_key, conn=conn)
+                            total_laps += len(laps)
+                            status.append(f"    Stored {len(laps)} laps")
+
+                            print("\n".join(status))
+        finally:
+            # Rebuild the indexes we dropped, even when the load fails
+            # partway (a locked database, a dropped connection, Ctrl-C) -
+            # otherwise the website is left doing full-table scans until
+            # the next initialize_database()
+            recreate_indexes()
+
+    # Precompute the rankings so the website can serve them directly
+    # instead of re-aggregating every lap on each page view.
+    if meetings_to_process:
+        # A run that fetched anything refreshes unconditionally: upserts
+        # can change lap times or fill in tire data in place, which the
+        # laps fingerprint (row count / max keys) cannot see.
+        refresh_materialized_rankings()
+    else:
+        # Nothing was fetched, so the laps table is exactly as the last
+        # run left it - only refresh if the stored results are missing
+        # or stale (e.g. a previous run crashed before refreshing).
+        ensure_materialized_rankings()
 
     # Print final summary
     print("\n" + "=" * 60)
@@ -472,7 +703,7 @@ def fetch_recent_data(year: int = TARGET_YEAR, num_meetings: int = NUM_RECENT_ME
     stats = get_statistics()
 
     print(f"\n SUMMARY:")
-    print(f"  - Meetings collected: {len(recent_meetings)}")
+    print(f"  - Meetings collected: {len(meetings_to_process)}")
     print(f"  - Sessions collected: {total_sessions}")
     print(f"  - Total laps collected: {total_laps}")
     print(f"  - Unique drivers: {len(all_drivers)}")
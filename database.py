@@ -8,8 +8,12 @@ Think of a database as a collection of spreadsheets (called "tables"), where
 each table holds a specific type of data (meetings, sessions, laps, etc.).
 """
 
+import atexit
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
+from operator import itemgetter
 from config import DATABASE_PATH
 
 
@@ -17,29 +21,222 @@ from config import DATABASE_PATH
 # DATABASE CONNECTION HELPER
 # =============================================================================
 
+# The one writable connection for this process, created lazily by
+# _get_shared_connection() and reused by every helper until exit
+_write_conn = None
+
+
+def _get_shared_connection():
+    """
+    Returns the process-wide writable connection, creating it on first use.
+
+    Opening a fresh SQLite connection re-reads the database header,
+    re-applies every PRAGMA, and starts with a cold page cache. Every
+    helper used to pay that cost per call; sharing one connection pays it
+    once per process. Writes all happen from one thread at a time, so no
+    locking is needed (check_same_thread=False still lets the collector
+    hand the connection to a worker thread).
+    """
+    global _write_conn
+
+    if _write_conn is None:
+        # cached_statements: sqlite3 keeps compiled statements in a
+        # per-connection cache keyed on the SQL text. The default of 100
+        # is tight once the insert constants, analyzer queries, and
+        # PRAGMAs all compete for slots; 256 keeps everything compiled.
+        conn = sqlite3.connect(
+            DATABASE_PATH,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+
+        # This makes query results return as dictionaries instead of tuples
+        # So instead of row[0], row[1], we can use row['column_name']
+        conn.row_factory = sqlite3.Row
+
+        # WAL (write-ahead log) mode: commits append to a log file instead of
+        # rewriting database pages in place. This makes commits much cheaper
+        # and lets the website keep reading while the collector is writing.
+        conn.execute("PRAGMA journal_mode = WAL")
+
+        # In WAL mode, synchronous=NORMAL skips an fsync per commit but still
+        # guarantees the database can't be corrupted by a crash (a crash can
+        # only lose the very last commit, which we'd just re-fetch anyway)
+        conn.execute("PRAGMA synchronous = NORMAL")
+
+        # Tune SQLite for our read-heavy workload:
+        # - cache_size: 64MB page cache (negative = size in KB) so repeated
+        #   aggregations hit memory instead of disk
+        # - temp_store: keep sort/temp structures in memory
+        # - mmap_size: memory-map up to 256MB of the database file so reads
+        #   skip a copy through SQLite's own buffers
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+
+        # Close cleanly once, when the process exits
+        atexit.register(conn.close)
+
+        _write_conn = conn
+
+    return _write_conn
+
+
 @contextmanager
 def get_db_connection():
     """
-    Creates a connection to the database.
+    Yields the shared database connection.
 
-    The @contextmanager decorator lets us use this with the 'with' statement,
-    which automatically closes the connection when we're done (even if errors occur).
+    This stays a context manager so existing `with get_db_connection() as
+    conn:` call sites keep working unchanged, but the connection is no
+    longer closed when the block ends - it lives for the whole process
+    and keeps its warm page cache and compiled-statement cache.
 
     Usage:
         with get_db_connection() as conn:
             # do database stuff here
-        # connection is automatically closed after this block
     """
-    conn = sqlite3.connect(DATABASE_PATH)
+    yield _get_shared_connection()
 
-    # This makes query results return as dictionaries instead of tuples
-    # So instead of row[0], row[1], we can use row['column_name']
-    conn.row_factory = sqlite3.Row
 
+@contextmanager
+def transaction(conn):
+    """
+    Groups many writes on an existing connection into one transaction.
+
+    SQLite syncs to disk on every commit, so committing after each row is
+    by far the slowest way to bulk-load data. Wrapping a whole batch in
+    BEGIN/COMMIT pays that sync cost once instead of thousands of times.
+    Rolls back automatically if anything inside the block raises.
+
+    Usage:
+        with get_db_connection() as conn:
+            with transaction(conn):
+                insert_meeting(meeting, conn=conn)
+                bulk_insert_laps(laps, session_key, conn=conn)
+    """
+    # BEGIN IMMEDIATE takes the write lock up front, so we fail fast if
+    # another process is writing instead of failing mid-batch
+    conn.execute("BEGIN IMMEDIATE")
     try:
         yield conn
-    finally:
-        conn.close()
+    except Exception:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+
+
+@contextmanager
+def _writable(conn):
+    """
+    Yields a connection the insert helpers can write on.
+
+    If the caller passed a connection, reuse it and leave committing to
+    the caller (usually via transaction() above). Otherwise open a
+    temporary connection that commits and closes when the block ends, so
+    each helper still works standalone.
+    """
+    if conn is not None:
+        yield conn
+    else:
+        with get_db_connection() as own_conn:
+            yield own_conn
+            own_conn.commit()
+
+
+# Each thread keeps one long-lived read-only connection here, so query
+# functions don't pay the connect + page-cache-warmup cost on every call
+_read_local = threading.local()
+
+# URI of the shared in-memory replica (see load_memory_replica). With
+# mode=memory&cache=shared, every connection to this URI sees the same
+# in-memory database instead of each getting its own empty one.
+_MEMORY_DB_URI = "file:f1_replica?mode=memory&cache=shared"
+
+# Connection that keeps the shared in-memory replica alive; None means
+# reads go to the on-disk database as usual
+_memory_anchor = None
+
+
+def load_memory_replica():
+    """
+    Copies the on-disk database into a shared in-memory replica and
+    points all read connections opened afterwards at it.
+
+    A season of F1 laps easily fits in RAM, and the data only changes
+    when the collector runs, so the website can serve every read from
+    memory. Call this at startup (before handling requests) - threads
+    that already opened a disk connection keep using it.
+
+    The collector still writes to the on-disk database; reload the
+    replica (or restart the server) to pick up newly ingested data.
+    """
+    global _memory_anchor
+
+    # This connection keeps the shared in-memory database alive for the
+    # lifetime of the process
+    anchor = sqlite3.connect(_MEMORY_DB_URI, uri=True, check_same_thread=False)
+
+    # Copy every table and index from disk into memory in one pass
+    with get_db_connection() as disk_conn:
+        disk_conn.backup(anchor)
+
+    _memory_anchor = anchor
+
+    # Make sure this thread's next read uses the replica
+    _read_local.conn = None
+
+    print("In-memory database replica loaded.")
+
+
+@contextmanager
+def get_read_connection():
+    """
+    Yields a long-lived, read-only connection for query functions.
+
+    Opening a fresh SQLite connection on every query throws away the page
+    cache each time. Instead, each thread (the web server's workers each
+    get their own) opens one read-only connection on first use and reuses
+    it for all later queries. The collector keeps using regular writable
+    connections via get_db_connection().
+    """
+    conn = getattr(_read_local, 'conn', None)
+
+    if conn is None and _memory_anchor is not None:
+        # Reads are served from the in-memory replica (cached_statements
+        # raised for the same reason as the shared write connection)
+        conn = sqlite3.connect(_MEMORY_DB_URI, uri=True, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = 1")
+        _read_local.conn = conn
+
+    if conn is None:
+        try:
+            conn = sqlite3.connect(
+                f"file:{DATABASE_PATH}?mode=ro",
+                uri=True,
+                cached_statements=256,
+            )
+        except sqlite3.OperationalError:
+            # The database file doesn't exist yet - fall back to a normal
+            # connection (which creates the file) so first runs still work
+            with get_db_connection() as fallback_conn:
+                yield fallback_conn
+            return
+
+        conn.row_factory = sqlite3.Row
+
+        # Same read tuning as get_db_connection, plus a safety net that
+        # rejects any accidental write on this connection
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA query_only = 1")
+
+        _read_local.conn = conn
+
+    yield conn
 
 
 # =============================================================================
@@ -48,7 +245,7 @@ def get_db_connection():
 
 def initialize_database():
     """
-    Creates all the tables we need if they don't already exist.
+    Creates all the tables and indexes we need if they don't already exist.
 
     This is safe to run multiple times - it won't delete existing data.
     The 'IF NOT EXISTS' clause means it only creates tables that are missing.
@@ -57,250 +254,458 @@ def initialize_database():
     with get_db_connection() as conn:
         cursor = conn.cursor()
 
-        # -----------------------------------------------------------------
-        # TABLE: meetings
-        # -----------------------------------------------------------------
-        # Stores information about race weekends (e.g., "Abu Dhabi Grand Prix")
-        # Each row represents one race weekend
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS meetings (
-                -- meeting_key: Unique identifier from OpenF1 API
-                meeting_key INTEGER PRIMARY KEY,
+        _create_tables(cursor)
+        _create_indexes(cursor)
+
+        # Save all our changes to the database
+        conn.commit()
 
-                -- meeting_name: Human-readable name like "Abu Dhabi Grand Prix"
-                meeting_name TEXT NOT NULL,
+        print("Database initialized successfully!")
+        print(f"Database location: {DATABASE_PATH}")
 
-                -- country_name: Country where the race takes place
-                country_name TEXT,
 
-                -- circuit_name: Name of the circuit (e.g., "Yas Marina Circuit")
-                circuit_name TEXT,
+# The whole table schema as one SQL script. executescript compiles and
+# runs the entire block in a single call (inside one implicit
+# transaction), instead of a prepare/step/finalize round trip per
+# statement - a small but free win for CLI cold starts.
+_SCHEMA_SQL = """
+-- -----------------------------------------------------------------
+-- TABLE: meetings
+-- -----------------------------------------------------------------
+-- Stores information about race weekends (e.g., "Abu Dhabi Grand Prix")
+-- Each row represents one race weekend
+CREATE TABLE IF NOT EXISTS meetings (
+    -- meeting_key: Unique identifier from OpenF1 API
+    meeting_key INTEGER PRIMARY KEY,
+
+    -- meeting_name: Human-readable name like "Abu Dhabi Grand Prix"
+    meeting_name TEXT NOT NULL,
 
-                -- date_start: When the race weekend begins (ISO format)
-                date_start TEXT,
+    -- country_name: Country where the race takes place
+    country_name TEXT,
 
-                -- year: The F1 season year (2024, 2025, etc.)
-                year INTEGER NOT NULL
-            )
-        """)
+    -- circuit_name: Name of the circuit (e.g., "Yas Marina Circuit")
+    circuit_name TEXT,
 
-        # -----------------------------------------------------------------
-        # TABLE: sessions
-        # -----------------------------------------------------------------
-        # Stores individual sessions within a race weekend
-        # Each weekend has multiple sessions: FP1, FP2, FP3, Quali, Race
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                -- session_key: Unique identifier from OpenF1 API
-                session_key INTEGER PRIMARY KEY,
+    -- date_start: When the race weekend begins (ISO format)
+    date_start TEXT,
 
-                -- meeting_key: Links this session to its race weekend
-                meeting_key INTEGER NOT NULL,
+    -- year: The F1 season year (2024, 2025, etc.)
+    year INTEGER NOT NULL
+);
 
-                -- session_name: Human-readable name like "Practice 1", "Qualifying"
-                session_name TEXT NOT NULL,
+-- -----------------------------------------------------------------
+-- TABLE: sessions
+-- -----------------------------------------------------------------
+-- Stores individual sessions within a race weekend
+-- Each weekend has multiple sessions: FP1, FP2, FP3, Quali, Race
+CREATE TABLE IF NOT EXISTS sessions (
+    -- session_key: Unique identifier from OpenF1 API
+    session_key INTEGER PRIMARY KEY,
 
-                -- session_type: Standardized type (Practice, Qualifying, Race, etc.)
-                session_type TEXT,
+    -- meeting_key: Links this session to its race weekend
+    meeting_key INTEGER NOT NULL,
 
-                -- date_start: When this session started
-                date_start TEXT,
+    -- session_name: Human-readable name like "Practice 1", "Qualifying"
+    session_name TEXT NOT NULL,
 
-                -- date_end: When this session ended
-                date_end TEXT,
+    -- session_type: Standardized type (Practice, Qualifying, Race, etc.)
+    session_type TEXT,
 
-                -- FOREIGN KEY: Ensures meeting_key matches a real meeting
-                FOREIGN KEY (meeting_key) REFERENCES meetings(meeting_key)
-            )
-        """)
+    -- date_start: When this session started
+    date_start TEXT,
 
-        # -----------------------------------------------------------------
-        # TABLE: drivers
-        # -----------------------------------------------------------------
-        # Stores driver information for each session
-        # Drivers can change teams between races, so we store per-session
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS drivers (
-                -- id: Auto-generated unique ID for each record
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+    -- date_end: When this session ended
+    date_end TEXT,
 
-                -- driver_number: The car number (e.g., 1 for Verstappen, 44 for Hamilton)
-                driver_number INTEGER NOT NULL,
+    -- FOREIGN KEY: Ensures meeting_key matches a real meeting
+    FOREIGN KEY (meeting_key) REFERENCES meetings(meeting_key)
+);
 
-                -- session_key: Links this driver record to a specific session
-                session_key INTEGER NOT NULL,
+-- -----------------------------------------------------------------
+-- TABLE: drivers
+-- -----------------------------------------------------------------
+-- Stores driver information for each session
+-- Drivers can change teams between races, so we store per-session
+CREATE TABLE IF NOT EXISTS drivers (
+    -- id: Auto-generated unique ID for each record.
+    -- Plain INTEGER PRIMARY KEY (no AUTOINCREMENT): SQLite still
+    -- auto-assigns ids, but skips the extra bookkeeping table
+    -- write that AUTOINCREMENT does on every insert
+    id INTEGER PRIMARY KEY,
 
-                -- full_name: Driver's full name (e.g., "Max VERSTAPPEN")
-                full_name TEXT,
+    -- driver_number: The car number (e.g., 1 for Verstappen, 44 for Hamilton)
+    driver_number INTEGER NOT NULL,
 
-                -- team_name: Team name (e.g., "Red Bull Racing")
-                team_name TEXT,
+    -- session_key: Links this driver record to a specific session
+    session_key INTEGER NOT NULL,
 
-                -- team_color: Hex color code for the team (for charts/display)
-                team_color TEXT,
+    -- full_name: Driver's full name (e.g., "Max VERSTAPPEN")
+    full_name TEXT,
 
-                -- name_acronym: Three-letter code (e.g., "VER", "HAM")
-                name_acronym TEXT,
+    -- team_name: Team name (e.g., "Red Bull Racing")
+    team_name TEXT,
 
-                -- Ensure we don't have duplicate driver entries per session
-                UNIQUE(driver_number, session_key),
+    -- team_color: Hex color code for the team (for charts/display)
+    team_color TEXT,
 
-                FOREIGN KEY (session_key) REFERENCES sessions(session_key)
-            )
-        """)
+    -- name_acronym: Three-letter code (e.g., "VER", "HAM")
+    name_acronym TEXT,
 
-        # -----------------------------------------------------------------
-        # TABLE: laps
-        # -----------------------------------------------------------------
-        # Stores every lap time from every session
-        # This is our main data table for pace analysis
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS laps (
-                -- id: Auto-generated unique ID for each lap record
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+    -- Ensure we don't have duplicate driver entries per session
+    UNIQUE(driver_number, session_key),
 
-                -- session_key: Which session this lap belongs to
-                session_key INTEGER NOT NULL,
+    FOREIGN KEY (session_key) REFERENCES sessions(session_key)
+);
 
-                -- driver_number: Which driver set this lap
-                driver_number INTEGER NOT NULL,
+-- -----------------------------------------------------------------
+-- TABLE: laps
+-- -----------------------------------------------------------------
+-- Stores every lap time from every session
+-- This is our main data table for pace analysis
+CREATE TABLE IF NOT EXISTS laps (
+    -- id: Auto-generated unique ID for each lap record
+    -- (plain INTEGER PRIMARY KEY - see the drivers table note)
+    id INTEGER PRIMARY KEY,
 
-                -- lap_number: The lap number within the session (1, 2, 3, etc.)
-                lap_number INTEGER NOT NULL,
+    -- session_key: Which session this lap belongs to
+    session_key INTEGER NOT NULL,
 
-                -- lap_duration: Total lap time in seconds (e.g., 83.456)
-                lap_duration REAL,
+    -- driver_number: Which driver set this lap
+    driver_number INTEGER NOT NULL,
 
-                -- sector_1_duration: Time for sector 1 in seconds
-                sector_1_duration REAL,
+    -- lap_number: The lap number within the session (1, 2, 3, etc.)
+    lap_number INTEGER NOT NULL,
 
-                -- sector_2_duration: Time for sector 2 in seconds
-                sector_2_duration REAL,
+    -- lap_duration: Total lap time in seconds (e.g., 83.456)
+    lap_duration REAL,
 
-                -- sector_3_duration: Time for sector 3 in seconds
-                sector_3_duration REAL,
+    -- sector_1_duration: Time for sector 1 in seconds
+    sector_1_duration REAL,
 
-                -- speed_trap: Speed at the speed trap point (km/h)
-                speed_trap REAL,
+    -- sector_2_duration: Time for sector 2 in seconds
+    sector_2_duration REAL,
 
-                -- is_pit_out_lap: True if this is a lap coming out of the pits
-                -- Pit out laps are always slow and should be excluded from analysis
-                is_pit_out_lap INTEGER DEFAULT 0,
+    -- sector_3_duration: Time for sector 3 in seconds
+    sector_3_duration REAL,
 
-                -- compound: Tire compound used (SOFT, MEDIUM, HARD, etc.)
-                compound TEXT,
+    -- speed_trap: Speed at the speed trap point (km/h)
+    speed_trap REAL,
 
-                -- tire_age: How many laps old the tires are
-                tire_age INTEGER,
+    -- is_pit_out_lap: True if this is a lap coming out of the pits
+    -- Pit out laps are always slow and should be excluded from analysis
+    is_pit_out_lap INTEGER DEFAULT 0,
 
-                -- is_valid_for_ranking: Whether to include this lap in pace calculations
-                -- We mark outliers, pit laps, etc. as invalid (0 = invalid, 1 = valid)
-                is_valid_for_ranking INTEGER DEFAULT 1,
+    -- compound: Tire compound used (SOFT, MEDIUM, HARD, etc.)
+    compound TEXT,
 
-                -- Ensure we don't have duplicate lap entries
-                UNIQUE(session_key, driver_number, lap_number),
+    -- tire_age: How many laps old the tires are
+    tire_age INTEGER,
 
-                FOREIGN KEY (session_key) REFERENCES sessions(session_key)
-            )
-        """)
+    -- is_valid_for_ranking: Whether to include this lap in pace calculations
+    -- We mark outliers, pit laps, etc. as invalid (0 = invalid, 1 = valid)
+    is_valid_for_ranking INTEGER DEFAULT 1,
 
-        # -----------------------------------------------------------------
-        # TABLE: stints
-        # -----------------------------------------------------------------
-        # Stores tire stint information (which tire compound for which laps)
-        # A "stint" is the period between pit stops on one set of tires
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS stints (
-                -- id: Auto-generated unique ID
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+    -- Ensure we don't have duplicate lap entries
+    UNIQUE(session_key, driver_number, lap_number),
 
-                -- session_key: Which session this stint belongs to
-                session_key INTEGER NOT NULL,
+    FOREIGN KEY (session_key) REFERENCES sessions(session_key)
+);
 
-                -- driver_number: Which driver this stint belongs to
-                driver_number INTEGER NOT NULL,
+-- -----------------------------------------------------------------
+-- TABLE: stints
+-- -----------------------------------------------------------------
+-- Stores tire stint information (which tire compound for which laps)
+-- A "stint" is the period between pit stops on one set of tires
+CREATE TABLE IF NOT EXISTS stints (
+    -- id: Auto-generated unique ID
+    -- (plain INTEGER PRIMARY KEY - see the drivers table note)
+    id INTEGER PRIMARY KEY,
 
-                -- stint_number: First stint = 1, after first pit = 2, etc.
-                stint_number INTEGER NOT NULL,
+    -- session_key: Which session this stint belongs to
+    session_key INTEGER NOT NULL,
 
-                -- compound: Tire compound (SOFT, MEDIUM, HARD, etc.)
-                compound TEXT,
+    -- driver_number: Which driver this stint belongs to
+    driver_number INTEGER NOT NULL,
 
-                -- lap_start: First lap number of this stint
-                lap_start INTEGER,
+    -- stint_number: First stint = 1, after first pit = 2, etc.
+    stint_number INTEGER NOT NULL,
 
-                -- lap_end: Last lap number of this stint
-                lap_end INTEGER,
+    -- compound: Tire compound (SOFT, MEDIUM, HARD, etc.)
+    compound TEXT,
 
-                -- tire_age_at_start: How old the tires were at stint start
-                -- (Usually 0 for new tires, but can be higher for used tires)
-                tire_age_at_start INTEGER DEFAULT 0,
+    -- lap_start: First lap number of this stint
+    lap_start INTEGER,
 
-                -- Ensure we don't have duplicate stint entries
-                UNIQUE(session_key, driver_number, stint_number),
+    -- lap_end: Last lap number of this stint
+    lap_end INTEGER,
 
-                FOREIGN KEY (session_key) REFERENCES sessions(session_key)
-            )
-        """)
+    -- tire_age_at_start: How old the tires were at stint start
+    -- (Usually 0 for new tires, but can be higher for used tires)
+    tire_age_at_start INTEGER DEFAULT 0,
 
-        # -----------------------------------------------------------------
-        # Create indexes for faster queries
-        # -----------------------------------------------------------------
-        # Indexes make database queries faster, like an index in a book
-        # helps you find pages faster
+    -- Ensure we don't have duplicate stint entries
+    UNIQUE(session_key, driver_number, stint_number),
 
-        # Index for looking up laps by session
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_laps_session
-            ON laps(session_key)
-        """)
+    FOREIGN KEY (session_key) REFERENCES sessions(session_key)
+);
 
-        # Index for looking up laps by driver
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_laps_driver
-            ON laps(driver_number)
-        """)
+-- -----------------------------------------------------------------
+-- TABLE: rankings_cache
+-- -----------------------------------------------------------------
+-- Stores precomputed ranking results as JSON blobs so the website
+-- can read them directly instead of re-aggregating every lap on
+-- each page view. The collector refreshes these after every ingest.
+CREATE TABLE IF NOT EXISTS rankings_cache (
+    -- scope: What kind of result this is (e.g., 'rankings',
+    -- 'meeting_breakdown')
+    scope TEXT NOT NULL,
 
-        # Index for looking up valid laps quickly
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_laps_valid
-            ON laps(is_valid_for_ranking)
-        """)
+    -- key: Optional sub-key within the scope (e.g., a
+    -- meeting_key). 0 for global results.
+    key INTEGER NOT NULL DEFAULT 0,
 
-        # Index for looking up sessions by meeting
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_sessions_meeting
-            ON sessions(meeting_key)
-        """)
+    -- payload: The precomputed result, serialized as JSON
+    payload TEXT,
 
-        # Save all our changes to the database
+    -- updated_at: Unix timestamp of when this was computed
+    updated_at REAL,
+
+    PRIMARY KEY (scope, key)
+);
+"""
+
+
+def _create_tables(cursor):
+    """
+    Creates all the tables (but not the indexes - see _create_indexes).
+
+    Tables and indexes are created by separate functions so the collector
+    can drop the indexes during a bulk load and rebuild them afterwards
+    without touching the tables.
+    """
+    cursor.executescript(_SCHEMA_SQL)
+
+
+def _create_indexes(cursor):
+    """
+    Creates the secondary indexes (safe to run repeatedly).
+
+    Kept separate from _create_tables so a bulk load can drop these,
+    insert without per-row index maintenance, and rebuild them once at
+    the end (see drop_lap_indexes / recreate_indexes).
+    """
+
+    # -----------------------------------------------------------------
+    # Create indexes for faster queries
+    # -----------------------------------------------------------------
+    # Indexes make database queries faster, like an index in a book
+    # helps you find pages faster
+
+    # Covering index for the pace analyzer's hot queries, which filter
+    # laps by session and validity and then read the driver, tire, and
+    # timing columns. Because every column those queries touch is IN the
+    # index, SQLite answers them from the index B-tree alone and never
+    # has to jump back into the laps table row by row.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_laps_pace
+        ON laps(session_key, is_valid_for_ranking, driver_number,
+                compound, tire_age, lap_duration)
+    """)
+
+    # idx_laps_pace's prefix also covers plain session_key and
+    # session_key + validity lookups, so the narrower indexes it
+    # replaces are dropped from databases that still have them
+    cursor.execute("DROP INDEX IF EXISTS idx_laps_session")
+    cursor.execute("DROP INDEX IF EXISTS idx_laps_valid")
+    cursor.execute("DROP INDEX IF EXISTS idx_laps_session_valid")
+
+    # Partial covering index for the whole-database ranking scans, which
+    # read every valid lap regardless of session. The WHERE clause means
+    # only rows that pass the ranking filter are stored in this B-tree,
+    # so those scans walk a tree containing exactly the laps they want
+    # (and all the columns they read) instead of filtering the full table.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_laps_valid_scan
+        ON laps(session_key, driver_number, lap_number,
+                lap_duration, compound, tire_age)
+        WHERE is_valid_for_ranking = 1 AND lap_duration IS NOT NULL
+    """)
+
+    # Index for looking up laps by driver
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_laps_driver
+        ON laps(driver_number)
+    """)
+
+    # Index for looking up sessions by meeting
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sessions_meeting
+        ON sessions(meeting_key)
+    """)
+
+    # Composite index for joining laps to their driver records
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_laps_driver_session
+        ON laps(driver_number, session_key)
+    """)
+
+    # Composite index for looking up a driver's stints in a session
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_stints_session_driver
+        ON stints(session_key, driver_number)
+    """)
+
+
+# Names of the indexes on the high-volume tables (laps and stints).
+# The small idx_sessions_meeting index is deliberately not listed - it
+# costs almost nothing to maintain and the collector reads through it.
+_LAP_INDEX_NAMES = (
+    'idx_laps_pace',
+    'idx_laps_valid_scan',
+    'idx_laps_driver',
+    'idx_laps_driver_session',
+    'idx_stints_session_driver',
+)
+
+
+def drop_lap_indexes():
+    """
+    Drops the secondary indexes on the laps and stints tables.
+
+    Every index is a separate B-tree that SQLite has to update for each
+    inserted row, so a bulk load runs noticeably faster without them.
+    Call recreate_indexes() once the load is done - one sorted rebuild at
+    the end is much cheaper than maintaining the trees row by row.
+
+    The UNIQUE constraints (and their automatic indexes) stay in place,
+    so duplicate detection during the load still works.
+    """
+    with get_db_connection() as conn:
+        for index_name in _LAP_INDEX_NAMES:
+            conn.execute(f"DROP INDEX IF EXISTS {index_name}")
         conn.commit()
 
-        print("Database initialized successfully!")
-        print(f"Database location: {DATABASE_PATH}")
+
+def recreate_indexes():
+    """
+    Rebuilds all secondary indexes after a bulk load (see drop_lap_indexes).
+    """
+    with get_db_connection() as conn:
+        _create_indexes(conn.cursor())
+        conn.commit()
 
 
 # =============================================================================
 # DATA INSERTION FUNCTIONS
 # =============================================================================
 
-def insert_meeting(meeting_data):
+# The lap INSERT is by far our most-executed statement, so its SQL lives
+# at module scope. sqlite3 caches compiled statements keyed on the SQL
+# text, and reusing the exact same string object means every call after
+# the first skips re-parsing and re-compiling the statement.
+_INSERT_LAP_SQL = """
+    INSERT INTO laps
+    (session_key, driver_number, lap_number, lap_duration,
+     sector_1_duration, sector_2_duration, sector_3_duration,
+     speed_trap, is_pit_out_lap, compound, tire_age, is_valid_for_ranking)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(session_key, driver_number, lap_number) DO UPDATE SET
+        lap_duration = excluded.lap_duration,
+        sector_1_duration = excluded.sector_1_duration,
+        sector_2_duration = excluded.sector_2_duration,
+        sector_3_duration = excluded.sector_3_duration,
+        speed_trap = excluded.speed_trap,
+        is_pit_out_lap = excluded.is_pit_out_lap,
+        compound = excluded.compound,
+        tire_age = excluded.tire_age,
+        is_valid_for_ranking = excluded.is_valid_for_ranking
+"""
+
+# The session, driver, and stint upserts are shared by their per-row and
+# bulk helpers, so they live at module scope too. All of them update the
+# existing row in place on conflict rather than OR REPLACE's
+# delete-and-reinsert, which would touch every index twice.
+_INSERT_SESSION_SQL = """
+    INSERT INTO sessions
+    (session_key, meeting_key, session_name, session_type, date_start, date_end)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(session_key) DO UPDATE SET
+        meeting_key = excluded.meeting_key,
+        session_name = excluded.session_name,
+        session_type = excluded.session_type,
+        date_start = excluded.date_start,
+        date_end = excluded.date_end
+"""
+
+_INSERT_DRIVER_SQL = """
+    INSERT INTO drivers
+    (driver_number, session_key, full_name, team_name, team_color, name_acronym)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(driver_number, session_key) DO UPDATE SET
+        full_name = excluded.full_name,
+        team_name = excluded.team_name,
+        team_color = excluded.team_color,
+        name_acronym = excluded.name_acronym
+"""
+
+_INSERT_STINT_SQL = """
+    INSERT INTO stints
+    (session_key, driver_number, stint_number, compound,
+     lap_start, lap_end, tire_age_at_start)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(session_key, driver_number, stint_number) DO UPDATE SET
+        compound = excluded.compound,
+        lap_start = excluded.lap_start,
+        lap_end = excluded.lap_end,
+        tire_age_at_start = excluded.tire_age_at_start
+"""
+
+# The lap dictionary keys bound to _INSERT_LAP_SQL's placeholders, in
+# column order (everything after the leading session_key). itemgetter
+# compiled once at import pulls all eleven values from a lap dict in a
+# single C call instead of eleven Python-level .get() calls per lap.
+_LAP_FIELDS = (
+    'driver_number',
+    'lap_number',
+    'lap_duration',
+    'duration_sector_1',
+    'duration_sector_2',
+    'duration_sector_3',
+    'st_speed',
+    'is_pit_out_lap',
+    'compound',
+    'tire_age',
+    'is_valid_for_ranking',
+)
+_LAP_GETTER = itemgetter(*_LAP_FIELDS)
+
+
+def insert_meeting(meeting_data, conn=None):
     """
     Inserts a race weekend (meeting) into the database.
-    Uses INSERT OR REPLACE to update if the meeting already exists.
+    Uses an upsert to update the row in place if the meeting already
+    exists (INSERT OR REPLACE would delete and re-insert instead, which
+    rewrites every index entry and changes the row's internal id).
 
     Args:
         meeting_data: Dictionary with meeting information from the API
+        conn: Optional connection to reuse (caller owns the transaction)
 
     Returns:
         The meeting_key of the inserted/updated meeting
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO meetings
+    with _writable(conn) as conn:
+        conn.execute("""
+            INSERT INTO meetings
             (meeting_key, meeting_name, country_name, circuit_name, date_start, year)
             VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(meeting_key) DO UPDATE SET
+                meeting_name = excluded.meeting_name,
+                country_name = excluded.country_name,
+                circuit_name = excluded.circuit_name,
+                date_start = excluded.date_start,
+                year = excluded.year
         """, (
             meeting_data.get('meeting_key'),
             meeting_data.get('meeting_name'),
@@ -309,27 +714,22 @@ def insert_meeting(meeting_data):
             meeting_data.get('date_start'),
             meeting_data.get('year')
         ))
-        conn.commit()
         return meeting_data.get('meeting_key')
 
 
-def insert_session(session_data):
+def insert_session(session_data, conn=None):
     """
     Inserts a session (FP1, Quali, Race, etc.) into the database.
 
     Args:
         session_data: Dictionary with session information from the API
+        conn: Optional connection to reuse (caller owns the transaction)
 
     Returns:
         The session_key of the inserted/updated session
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO sessions
-            (session_key, meeting_key, session_name, session_type, date_start, date_end)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+    with _writable(conn) as conn:
+        conn.execute(_INSERT_SESSION_SQL, (
             session_data.get('session_key'),
             session_data.get('meeting_key'),
             session_data.get('session_name'),
@@ -337,25 +737,45 @@ def insert_session(session_data):
             session_data.get('date_start'),
             session_data.get('date_end')
         ))
-        conn.commit()
         return session_data.get('session_key')
 
 
-def insert_driver(driver_data, session_key):
+def bulk_insert_sessions(sessions_list, conn=None):
+    """
+    Inserts all of a meeting's sessions at once.
+
+    A race weekend only has a handful of sessions, but executemany still
+    prepares the statement once instead of once per session.
+
+    Args:
+        sessions_list: List of session dictionaries from the API
+        conn: Optional connection to reuse (caller owns the transaction)
+    """
+    with _writable(conn) as conn:
+        conn.executemany(_INSERT_SESSION_SQL, [
+            (
+                session.get('session_key'),
+                session.get('meeting_key'),
+                session.get('session_name'),
+                session.get('session_type'),
+                session.get('date_start'),
+                session.get('date_end')
+            )
+            for session in sessions_list
+        ])
+
+
+def insert_driver(driver_data, session_key, conn=None):
     """
     Inserts a driver record for a specific session.
 
     Args:
         driver_data: Dictionary with driver information from the API
         session_key: The session this driver record belongs to
+        conn: Optional connection to reuse (caller owns the transaction)
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO drivers
-            (driver_number, session_key, full_name, team_name, team_color, name_acronym)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+    with _writable(conn) as conn:
+        conn.execute(_INSERT_DRIVER_SQL, (
             driver_data.get('driver_number'),
             session_key,
             driver_data.get('full_name'),
@@ -363,26 +783,42 @@ def insert_driver(driver_data, session_key):
             driver_data.get('team_colour'),  # Note: API uses British spelling
             driver_data.get('name_acronym')
         ))
-        conn.commit()
 
 
-def insert_lap(lap_data, session_key):
+def bulk_insert_drivers(drivers_list, session_key, conn=None):
+    """
+    Inserts all of a session's driver records at once.
+
+    Args:
+        drivers_list: List of driver dictionaries from the API
+        session_key: The session these driver records belong to
+        conn: Optional connection to reuse (caller owns the transaction)
+    """
+    with _writable(conn) as conn:
+        conn.executemany(_INSERT_DRIVER_SQL, [
+            (
+                driver.get('driver_number'),
+                session_key,
+                driver.get('full_name'),
+                driver.get('team_name'),
+                driver.get('team_colour'),  # Note: API uses British spelling
+                driver.get('name_acronym')
+            )
+            for driver in drivers_list
+        ])
+
+
+def insert_lap(lap_data, session_key, conn=None):
     """
     Inserts a single lap record into the database.
 
     Args:
         lap_data: Dictionary with lap information
         session_key: The session this lap belongs to
+        conn: Optional connection to reuse (caller owns the transaction)
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO laps
-            (session_key, driver_number, lap_number, lap_duration,
-             sector_1_duration, sector_2_duration, sector_3_duration,
-             speed_trap, is_pit_out_lap, compound, tire_age, is_valid_for_ranking)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    with _writable(conn) as conn:
+        conn.execute(_INSERT_LAP_SQL, (
             session_key,
             lap_data.get('driver_number'),
             lap_data.get('lap_number'),
@@ -396,25 +832,19 @@ def insert_lap(lap_data, session_key):
             lap_data.get('tire_age'),
             1 if lap_data.get('is_valid_for_ranking', True) else 0
         ))
-        conn.commit()
 
 
-def insert_stint(stint_data, session_key):
+def insert_stint(stint_data, session_key, conn=None):
     """
     Inserts a tire stint record into the database.
 
     Args:
         stint_data: Dictionary with stint information from the API
         session_key: The session this stint belongs to
+        conn: Optional connection to reuse (caller owns the transaction)
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO stints
-            (session_key, driver_number, stint_number, compound,
-             lap_start, lap_end, tire_age_at_start)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
+    with _writable(conn) as conn:
+        conn.execute(_INSERT_STINT_SQL, (
             session_key,
             stint_data.get('driver_number'),
             stint_data.get('stint_number'),
@@ -423,48 +853,112 @@ def insert_stint(stint_data, session_key):
             stint_data.get('lap_end'),
             stint_data.get('tyre_age_at_start', 0)  # Note: API uses British spelling
         ))
-        conn.commit()
 
 
-def bulk_insert_laps(laps_list, session_key):
+def bulk_insert_laps(laps_list, session_key, conn=None):
     """
     Inserts multiple laps at once (more efficient than one at a time).
 
     Args:
         laps_list: List of lap dictionaries
         session_key: The session these laps belong to
+        conn: Optional connection to reuse (caller owns the transaction)
+    """
+    with _writable(conn) as conn:
+        # One pre-pass per batch: normalize the two flag fields to 0/1
+        # and fill in any field _LAP_GETTER reads that the API omitted
+        # (itemgetter raises KeyError on missing keys, unlike .get())
+        for lap in laps_list:
+            lap['is_pit_out_lap'] = 1 if lap.get('is_pit_out_lap') else 0
+            lap['is_valid_for_ranking'] = 1 if lap.get('is_valid_for_ranking', True) else 0
+            for field in _LAP_FIELDS:
+                lap.setdefault(field, None)
+
+        # Insert all laps in one operation. The generator feeds
+        # executemany row by row (no second copy of the batch in memory),
+        # and _LAP_GETTER extracts each record's values in one C call.
+        conn.executemany(
+            _INSERT_LAP_SQL,
+            ((session_key,) + _LAP_GETTER(lap) for lap in laps_list),
+        )
+
+
+def save_rankings_payload(scope, payload, key=0):
+    """
+    Stores a precomputed ranking result (as a JSON string) in the
+    rankings_cache table, replacing any previous result for that scope.
+
+    Args:
+        scope: What kind of result this is (e.g., 'rankings')
+        payload: The JSON-serialized result
+        key: Optional sub-key within the scope (e.g., a meeting_key)
     """
     with get_db_connection() as conn:
+        try:
+            conn.execute("""
+                INSERT OR REPLACE INTO rankings_cache (scope, key, payload, updated_at)
+                VALUES (?, ?, ?, ?)
+            """, (scope, key, payload, time.time()))
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet (database created before this
+            # feature, and initialize_database hasn't run) - skip
+            # persisting; the caller still has the computed results
+            return
+        conn.commit()
+
+
+def load_rankings_payload(scope, key=0):
+    """
+    Loads a precomputed ranking result from the rankings_cache table.
+
+    Args:
+        scope: What kind of result to load (e.g., 'rankings')
+        key: Optional sub-key within the scope
+
+    Returns:
+        The JSON string stored for this scope, or None if nothing is cached
+    """
+    with get_read_connection() as conn:
         cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT payload FROM rankings_cache WHERE scope = ? AND key = ?",
+                (scope, key)
+            )
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet (database created before this feature)
+            return None
+        row = cursor.fetchone()
+        return row['payload'] if row else None
 
-        # Prepare all the data for bulk insert
-        lap_records = []
-        for lap in laps_list:
-            lap_records.append((
+
+def bulk_insert_stints(stints_list, session_key, conn=None):
+    """
+    Inserts multiple stints at once (more efficient than one at a time).
+
+    Like bulk_insert_laps, this prepares the statement once instead of
+    paying per-row overhead.
+
+    Args:
+        stints_list: List of stint dictionaries
+        session_key: The session these stints belong to
+        conn: Optional connection to reuse (caller owns the transaction)
+    """
+    with _writable(conn) as conn:
+        stint_records = [
+            (
                 session_key,
-                lap.get('driver_number'),
-                lap.get('lap_number'),
-                lap.get('lap_duration'),
-                lap.get('duration_sector_1'),
-                lap.get('duration_sector_2'),
-                lap.get('duration_sector_3'),
-                lap.get('st_speed'),
-                1 if lap.get('is_pit_out_lap') else 0,
-                lap.get('compound'),
-                lap.get('tire_age'),
-                1 if lap.get('is_valid_for_ranking', True) else 0
-            ))
-
-        # Insert all laps in one operation
-        cursor.executemany("""
-            INSERT OR REPLACE INTO laps
-            (session_key, driver_number, lap_number, lap_duration,
-             sector_1_duration, sector_2_duration, sector_3_duration,
-             speed_trap, is_pit_out_lap, compound, tire_age, is_valid_for_ranking)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, lap_records)
+                stint.get('driver_number'),
+                stint.get('stint_number'),
+                stint.get('compound'),
+                stint.get('lap_start'),
+                stint.get('lap_end'),
+                stint.get('tyre_age_at_start', 0)  # Note: API uses British spelling
+            )
+            for stint in stints_list
+        ]
 
-        conn.commit()
+        conn.executemany(_INSERT_STINT_SQL, stint_records)
 
 
 # =============================================================================
@@ -485,7 +979,7 @@ def get_meeting_by_key(meeting_key):
     Returns:
         Dictionary with meeting details or None if not found
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT meeting_key, meeting_name, country_name, circuit_name, date_start, year
@@ -508,7 +1002,7 @@ def get_sessions_for_meeting(meeting_key):
     Returns:
         List of session dictionaries, ordered by date
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT session_key, meeting_key, session_name, session_type, date_start, date_end
@@ -516,8 +1010,7 @@ def get_sessions_for_meeting(meeting_key):
             WHERE meeting_key = ?
             ORDER BY date_start ASC
         """, (meeting_key,))
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in cursor]
 
 
 def get_session_by_meeting_and_type(meeting_key, session_name):
@@ -531,7 +1024,7 @@ def get_session_by_meeting_and_type(meeting_key, session_name):
     Returns:
         Dictionary with session details or None if not found
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("""
             SELECT session_key, meeting_key, session_name, session_type, date_start, date_end
@@ -544,6 +1037,52 @@ def get_session_by_meeting_and_type(meeting_key, session_name):
         return None
 
 
+def get_session_detail_bundle(meeting_key, session_name):
+    """
+    Fetches everything the session detail page needs in one connection:
+    the meeting, the requested session, and all of the meeting's sessions
+    (for tab navigation).
+
+    This replaces three separate round trips from the web route with a
+    single connection and two statements.
+
+    Args:
+        meeting_key: The meeting's unique identifier
+        session_name: The session name (e.g., "Practice 1", "Race")
+
+    Returns:
+        Tuple of (meeting, session, all_sessions). meeting and session
+        are None when not found; all_sessions is a (possibly empty) list.
+    """
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT meeting_key, meeting_name, country_name, circuit_name, date_start, year
+            FROM meetings
+            WHERE meeting_key = ?
+        """, (meeting_key,))
+        meeting_row = cursor.fetchone()
+        if not meeting_row:
+            return None, None, []
+
+        cursor.execute("""
+            SELECT session_key, meeting_key, session_name, session_type, date_start, date_end
+            FROM sessions
+            WHERE meeting_key = ?
+            ORDER BY date_start ASC
+        """, (meeting_key,))
+        all_sessions = [dict(row) for row in cursor]
+
+    # The requested session is already in the list we just fetched
+    session = next(
+        (s for s in all_sessions if s['session_name'] == session_name),
+        None
+    )
+
+    return dict(meeting_row), session, all_sessions
+
+
 def get_statistics():
     """
     Returns a summary of what data we have in the database.
@@ -552,41 +1091,49 @@ def get_statistics():
     Returns:
         Dictionary with counts of meetings, sessions, laps, and unique drivers
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
 
-        # Count meetings
-        cursor.execute("SELECT COUNT(*) as count FROM meetings")
-        meetings_count = cursor.fetchone()['count']
+        # All six counts in a single statement - each scalar subquery
+        # becomes one column of the single result row, so we prepare and
+        # execute one query instead of six round trips
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM meetings) AS meetings,
+                (SELECT COUNT(*) FROM sessions) AS sessions,
+                (SELECT COUNT(*) FROM laps) AS total_laps,
+                (SELECT COUNT(*) FROM laps
+                 WHERE is_valid_for_ranking = 1) AS valid_laps,
+                -- Count by name so the same driver isn't counted once
+                -- per session they appear in
+                (SELECT COUNT(DISTINCT full_name) FROM drivers) AS unique_drivers,
+                (SELECT COUNT(DISTINCT team_name) FROM drivers) AS teams
+        """)
 
-        # Count sessions
-        cursor.execute("SELECT COUNT(*) as count FROM sessions")
-        sessions_count = cursor.fetchone()['count']
+        return dict(cursor.fetchone())
 
-        # Count total laps
-        cursor.execute("SELECT COUNT(*) as count FROM laps")
-        laps_count = cursor.fetchone()['count']
 
-        # Count valid laps only
-        cursor.execute("SELECT COUNT(*) as count FROM laps WHERE is_valid_for_ranking = 1")
-        valid_laps_count = cursor.fetchone()['count']
+def session_has_laps(session_key):
+    """
+    Checks if we already have lap data for a specific session.
 
-        # Count unique drivers (by full_name to avoid counting same driver multiple times)
-        cursor.execute("SELECT COUNT(DISTINCT full_name) as count FROM drivers")
-        drivers_count = cursor.fetchone()['count']
+    Together with the session's end time, this lets the collector skip
+    re-downloading sessions that are finished and already stored.
 
-        # Count teams
-        cursor.execute("SELECT COUNT(DISTINCT team_name) as count FROM drivers")
-        teams_count = cursor.fetchone()['count']
+    Args:
+        session_key: The session's unique identifier
 
-        return {
-            'meetings': meetings_count,
-            'sessions': sessions_count,
-            'total_laps': laps_count,
-            'valid_laps': valid_laps_count,
-            'unique_drivers': drivers_count,
-            'teams': teams_count
-        }
+    Returns:
+        True if at least one lap is stored for the session
+    """
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        # EXISTS stops at the first matching lap instead of counting all
+        cursor.execute(
+            "SELECT EXISTS(SELECT 1 FROM laps WHERE session_key = ?) as has_laps",
+            (session_key,)
+        )
+        return cursor.fetchone()['has_laps'] > 0
 
 
 def meeting_exists(meeting_key):
@@ -600,7 +1147,7 @@ def meeting_exists(meeting_key):
     Returns:
         True if meeting exists, False otherwise
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
         cursor.execute(
             "SELECT COUNT(*) as count FROM meetings WHERE meeting_key = ?",
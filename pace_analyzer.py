@@ -16,10 +16,15 @@ fairly compare pace across different conditions.
 BASELINE: We normalize everything to "Medium tires, 50kg fuel, fresh tires"
 """
 
+import heapq
+import json
+import math
 import sqlite3
 from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
-from statistics import mean, median, stdev
+from functools import lru_cache
+from statistics import fmean
+from sys import intern
 
 from config import (
     DATABASE_PATH,
@@ -31,13 +36,81 @@ from config import (
     RACE_START_FUEL_LOAD_KG,
     SESSION_WEIGHTS,
 )
-from database import get_db_connection
+from database import (
+    get_read_connection,
+    save_rankings_payload,
+    load_rankings_payload,
+)
 
 
 # =============================================================================
 # PACE NORMALIZATION FUNCTIONS
 # =============================================================================
 
+# Tire compound adjustments relative to the MEDIUM baseline, computed
+# once from the config deltas instead of on every call:
+#   SOFT   = -1.0 - (-0.5) = -0.5  (soft is 0.5s faster than medium)
+#   MEDIUM = -0.5 - (-0.5) =  0    (baseline)
+#   HARD   =  0.0 - (-0.5) =  0.5  (hard is 0.5s slower than medium)
+# Unknown compounds fall back to the medium baseline (adjustment of 0
+# relative to a configured delta of 0).
+_MEDIUM_DELTA = TIRE_COMPOUND_DELTAS.get("MEDIUM", -0.5)
+_COMPOUND_ADJ = {
+    compound: delta - _MEDIUM_DELTA
+    for compound, delta in TIRE_COMPOUND_DELTAS.items()
+}
+
+# Fuel adjustments precomputed once at import time. The config values
+# never change while the program runs, so there's no reason to redo the
+# same multiplications on every lap.
+#
+# Each value is the full adjustment in seconds for a given fuel load,
+# relative to the 50kg baseline: (fuel_kg - 50) * FUEL_EFFECT_PER_KG.
+_FUEL_PER_LAP_ADJ = FUEL_CONSUMPTION_PER_LAP * FUEL_EFFECT_PER_KG
+_RACE_FUEL_BASE_ADJ = (RACE_START_FUEL_LOAD_KG - 50) * FUEL_EFFECT_PER_KG
+_SPRINT_FUEL_BASE_ADJ = (RACE_START_FUEL_LOAD_KG / 3 - 50) * FUEL_EFFECT_PER_KG
+_QUALI_FUEL_ADJ = (QUALI_FUEL_LOAD_KG - 50) * FUEL_EFFECT_PER_KG
+_EMPTY_TANK_ADJ = -50 * FUEL_EFFECT_PER_KG
+
+# Maps each session type to (adjustment at the start line, whether fuel
+# burns off as laps go by). One dictionary lookup replaces a chain of
+# string comparisons per lap; session types not listed here (Practice)
+# get no fuel adjustment.
+_SESSION_FUEL_PARAMS = {
+    'Race': (_RACE_FUEL_BASE_ADJ, True),
+    'Sprint': (_SPRINT_FUEL_BASE_ADJ, True),
+    'Qualifying': (_QUALI_FUEL_ADJ, False),
+    'Sprint Qualifying': (_QUALI_FUEL_ADJ, False),
+}
+
+
+@lru_cache(maxsize=1024)
+def _fuel_adjustment(session_type: str, lap_number: int) -> float:
+    """
+    Fuel adjustment in seconds for a given session type and lap number.
+
+    The adjustment only depends on these two values, and a session has
+    maybe 80 distinct lap numbers shared by all 20 drivers - so each
+    value is computed once and every repeat is a cache lookup. This is
+    effectively a lazily built per-session fuel table.
+    """
+    fuel_params = _SESSION_FUEL_PARAMS.get(session_type)
+    if fuel_params is None:
+        # Practice sessions have variable fuel loads we can't determine,
+        # so we don't adjust them (assume roughly mid-fuel)
+        return 0.0
+
+    start_line_adj, burns_fuel = fuel_params
+
+    if not burns_fuel:
+        # Qualifying fuel load doesn't meaningfully change per lap
+        return start_line_adj
+
+    # Start from a full tank and subtract what has burned off by this
+    # lap, never dropping below an empty tank
+    return max(start_line_adj - lap_number * _FUEL_PER_LAP_ADJ, _EMPTY_TANK_ADJ)
+
+
 def normalize_lap_time(
     raw_lap_time: float,
     compound: str,
@@ -76,27 +149,11 @@ def normalize_lap_time(
     # -----------------------------------------------------------------
     # Soft tires are faster, so we ADD time to soft lap times to normalize
     # Hard tires are slower, so we SUBTRACT time from hard lap times
-    # We're normalizing to MEDIUM as baseline
-
-    compound_delta = TIRE_COMPOUND_DELTAS.get(compound, 0)
-    # compound_delta is negative for soft (faster), so we subtract it
-    # This ADDS time to soft laps, making them comparable to medium
-    # For MEDIUM compound, delta is -0.5, so we add 0.5 to normalize to hard baseline
-    # Actually, let's normalize to MEDIUM as baseline (delta = 0 for medium)
+    # We're normalizing to MEDIUM as baseline; the per-compound
+    # adjustments are precomputed in _COMPOUND_ADJ above.
 
-    # Recalculate: we want MEDIUM as baseline
-    # SOFT is -1.0 (1 sec faster than hard) -> compared to medium, soft is 0.5 faster
-    # MEDIUM is -0.5 -> this is our baseline
-    # HARD is 0.0 -> 0.5 slower than medium
-
-    medium_delta = TIRE_COMPOUND_DELTAS.get("MEDIUM", -0.5)
-    compound_adjustment = compound_delta - medium_delta
-    # Now: SOFT = -1.0 - (-0.5) = -0.5 (soft is 0.5 faster than medium)
-    #      MEDIUM = -0.5 - (-0.5) = 0 (baseline)
-    #      HARD = 0 - (-0.5) = 0.5 (hard is 0.5 slower than medium)
-
-    # To normalize: subtract the adjustment (so soft laps get slower, hard laps get faster)
-    normalized_time -= compound_adjustment
+    # Subtract the adjustment (so soft laps get slower, hard laps get faster)
+    normalized_time -= _COMPOUND_ADJ.get(compound, -_MEDIUM_DELTA)
 
     # -----------------------------------------------------------------
     # ADJUSTMENT 2: Tire Degradation
@@ -109,43 +166,13 @@ def normalize_lap_time(
         normalized_time -= degradation
 
     # -----------------------------------------------------------------
-    # ADJUSTMENT 3: Fuel Load (Race sessions only)
+    # ADJUSTMENT 3: Fuel Load
     # -----------------------------------------------------------------
-    # In races, cars start heavy and get lighter. We estimate fuel load
-    # based on lap number and normalize to a middle-of-race fuel load.
-
-    if session_type == "Race":
-        # Estimate current fuel load
-        fuel_burned = lap_number * FUEL_CONSUMPTION_PER_LAP
-        current_fuel = max(0, RACE_START_FUEL_LOAD_KG - fuel_burned)
-
-        # Normalize to 50kg (roughly mid-race)
-        target_fuel = 50
-        fuel_difference = current_fuel - target_fuel
-
-        # More fuel = slower, so subtract the fuel effect
-        fuel_adjustment = fuel_difference * FUEL_EFFECT_PER_KG
-        normalized_time -= fuel_adjustment
-
-    elif session_type == "Sprint":
-        # Sprint races have about 1/3 the fuel
-        sprint_start_fuel = RACE_START_FUEL_LOAD_KG / 3
-        fuel_burned = lap_number * FUEL_CONSUMPTION_PER_LAP
-        current_fuel = max(0, sprint_start_fuel - fuel_burned)
-
-        target_fuel = 50
-        fuel_difference = current_fuel - target_fuel
-        fuel_adjustment = fuel_difference * FUEL_EFFECT_PER_KG
-        normalized_time -= fuel_adjustment
-
-    elif session_type in ["Qualifying", "Sprint Qualifying"]:
-        # Qualifying uses very low fuel - normalize this too
-        fuel_difference = QUALI_FUEL_LOAD_KG - 50
-        fuel_adjustment = fuel_difference * FUEL_EFFECT_PER_KG
-        normalized_time -= fuel_adjustment
-
-    # Practice sessions have variable fuel loads we can't determine,
-    # so we don't adjust them (assume roughly mid-fuel)
+    # In races, cars start heavy and get lighter; qualifying runs on a
+    # nearly empty tank. We normalize both to a middle-of-race 50kg.
+    # More fuel = slower, so subtract the (cached) fuel effect.
+
+    normalized_time -= _fuel_adjustment(session_type, lap_number)
 
     return normalized_time
 
@@ -154,33 +181,108 @@ def normalize_lap_time(
 # DATA RETRIEVAL FUNCTIONS
 # =============================================================================
 
+def _intern(value):
+    """
+    sys.intern for database values that may be NULL.
+
+    sqlite3 hands back a brand-new string object for every row, so a
+    driver with 500 laps means 500 copies of the same name. Interning
+    collapses them to one shared object, which both saves memory and
+    makes the dictionary grouping on these values compare by pointer
+    instead of character by character.
+    """
+    return intern(value) if type(value) is str else value
+
+
+# SQL fragment computing the normalized lap time (mirrors
+# normalize_lap_time): adjust for tire compound, tire degradation, and
+# the estimated fuel load for the session type. It expects the laps
+# table aliased as "l" and the sessions table as "s", and is shared by
+# every query that needs normalized times so the math lives in one place.
+_NORMALIZED_TIME_SQL = """
+                l.lap_duration
+                - (CASE l.compound
+                       WHEN 'SOFT' THEN :delta_soft
+                       WHEN 'MEDIUM' THEN :delta_medium
+                       WHEN 'HARD' THEN :delta_hard
+                       WHEN 'INTERMEDIATE' THEN :delta_inter
+                       WHEN 'WET' THEN :delta_wet
+                       ELSE 0 END
+                   - :delta_medium)
+                - (CASE WHEN l.tire_age > 0
+                        THEN l.tire_age * :degradation_per_lap
+                        ELSE 0 END)
+                - (CASE s.session_type
+                       WHEN 'Race' THEN
+                           (MAX(0, :race_fuel - l.lap_number * :fuel_per_lap) - 50)
+                           * :fuel_per_kg
+                       WHEN 'Sprint' THEN
+                           (MAX(0, :race_fuel / 3.0 - l.lap_number * :fuel_per_lap) - 50)
+                           * :fuel_per_kg
+                       WHEN 'Qualifying' THEN
+                           (:quali_fuel - 50) * :fuel_per_kg
+                       WHEN 'Sprint Qualifying' THEN
+                           (:quali_fuel - 50) * :fuel_per_kg
+                       ELSE 0 END)
+"""
+
+# Named parameters used by _NORMALIZED_TIME_SQL, bound from the config
+# constants once at import time
+_NORMALIZATION_PARAMS = {
+    'delta_soft': TIRE_COMPOUND_DELTAS.get('SOFT', 0),
+    'delta_medium': TIRE_COMPOUND_DELTAS.get('MEDIUM', -0.5),
+    'delta_hard': TIRE_COMPOUND_DELTAS.get('HARD', 0),
+    'delta_inter': TIRE_COMPOUND_DELTAS.get('INTERMEDIATE', 0),
+    'delta_wet': TIRE_COMPOUND_DELTAS.get('WET', 0),
+    'degradation_per_lap': TIRE_DEGRADATION_PER_LAP,
+    'race_fuel': RACE_START_FUEL_LOAD_KG,
+    'fuel_per_lap': FUEL_CONSUMPTION_PER_LAP,
+    'fuel_per_kg': FUEL_EFFECT_PER_KG,
+    'quali_fuel': QUALI_FUEL_LOAD_KG,
+}
+
+
 def get_all_valid_laps() -> List[Dict]:
     """
     Retrieves all valid laps from the database with driver and session info.
 
+    The normalized lap time (same math as normalize_lap_time) is computed
+    directly in the SQL query with the config constants bound as
+    parameters. SQLite evaluates the CASE arithmetic in its C engine
+    while scanning the rows, which is far faster than looping over every
+    lap again in Python afterwards. Retrieval and normalization are one
+    fused pass over the data; Python only materializes the finished
+    dictionaries at the boundary for the callers.
+
     Returns:
-        List of lap dictionaries with all relevant fields
+        List of lap dictionaries with all relevant fields, including a
+        precomputed 'normalized_time'
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
 
-        cursor.execute("""
+        # Plain tuples instead of sqlite3.Row for this scan. Row objects
+        # are handy for name-based access, but this query touches every
+        # lap in the database and we immediately repack each row into a
+        # dictionary anyway - skipping the Row wrapper saves one object
+        # allocation per lap.
+        cursor.row_factory = None
+
+        # Only the columns the breakdown code actually reads are
+        # selected. Every extra column here costs a Python object per
+        # lap across the whole result set, so the raw lap fields
+        # (duration, compound, tire age, ...) that only feed the
+        # normalization are left inside the SQL expression and never
+        # materialized per row.
+        cursor.execute(f"""
             SELECT
-                l.session_key,
-                l.driver_number,
-                l.lap_number,
-                l.lap_duration,
-                l.compound,
-                l.tire_age,
-                s.session_type,
-                s.session_name,
                 s.meeting_key,
                 d.full_name as driver_name,
                 d.team_name,
                 d.team_color,
                 d.name_acronym,
-                m.meeting_name,
-                m.circuit_name
+                {_NORMALIZED_TIME_SQL}
+                AS normalized_time
             FROM laps l
             JOIN sessions s ON l.session_key = s.session_key
             JOIN drivers d ON l.driver_number = d.driver_number AND l.session_key = d.session_key
@@ -188,46 +290,140 @@ def get_all_valid_laps() -> List[Dict]:
             WHERE l.is_valid_for_ranking = 1
             AND l.lap_duration IS NOT NULL
             ORDER BY m.date_start DESC, s.session_key, l.driver_number, l.lap_number
-        """)
+        """, _NORMALIZATION_PARAMS)
+
+        # Convert to list of dictionaries, indexing the tuples by
+        # position (the order matches the SELECT list above). Iterating
+        # the cursor streams rows straight out of SQLite, so the only
+        # full-size list ever held is the finished one - fetchall()
+        # would briefly keep a second copy of every row alive.
+        return [
+            {
+                'meeting_key': row[0],
+                'driver_name': _intern(row[1]),
+                'team_name': _intern(row[2]),
+                'team_color': _intern(row[3]),
+                'name_acronym': _intern(row[4]),
+                'normalized_time': row[5],
+            }
+            for row in cursor
+        ]
 
-        rows = cursor.fetchall()
 
-        # Convert to list of dictionaries
-        laps = []
-        for row in rows:
-            laps.append({
-                'session_key': row['session_key'],
-                'driver_number': row['driver_number'],
-                'lap_number': row['lap_number'],
-                'lap_duration': row['lap_duration'],
-                'compound': row['compound'],
-                'tire_age': row['tire_age'],
-                'session_type': row['session_type'],
-                'session_name': row['session_name'],
-                'meeting_key': row['meeting_key'],
-                'driver_name': row['driver_name'],
-                'team_name': row['team_name'],
-                'team_color': row['team_color'],
-                'name_acronym': row['name_acronym'],
-                'meeting_name': row['meeting_name'],
-                'circuit_name': row['circuit_name'],
-            })
+def get_driver_session_stats() -> List[Dict]:
+    """
+    Aggregates each driver's best laps per session type inside SQLite.
 
-        return laps
+    The pace score is built from the best 10% of a driver's laps in each
+    session type (minimum 3, maximum 20). Selecting those laps used to
+    mean sorting every driver's lap list in Python; here the database
+    does it instead: a window function ranks the normalized laps within
+    each (driver, session type) group, a second one counts the group,
+    and the outer query keeps only the laps under the 10% cutoff.
 
+    Returns:
+        One dictionary per (driver, session type) pair with the total
+        lap count, the fastest normalized lap, and the average, sum,
+        and sum of squares of the selected best laps (enough to compute
+        weighted averages and standard deviations without ever touching
+        individual laps in Python).
+    """
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+
+        cursor.execute(f"""
+            WITH normalized AS (
+                SELECT
+                    d.full_name AS driver_name,
+                    s.session_type,
+                    {_NORMALIZED_TIME_SQL}
+                    AS normalized_time
+                FROM laps l
+                JOIN sessions s ON l.session_key = s.session_key
+                JOIN drivers d ON l.driver_number = d.driver_number AND l.session_key = d.session_key
+                WHERE l.is_valid_for_ranking = 1
+                AND l.lap_duration IS NOT NULL
+            ),
+            ranked AS (
+                SELECT
+                    *,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY driver_name, session_type
+                        ORDER BY normalized_time
+                    ) AS lap_rank,
+                    COUNT(*) OVER (
+                        PARTITION BY driver_name, session_type
+                    ) AS lap_count
+                FROM normalized
+            )
+            SELECT
+                driver_name,
+                session_type,
+                lap_count,
+                AVG(normalized_time) AS average_pace,
+                MIN(normalized_time) AS best_lap,
+                COUNT(*) AS best_count,
+                SUM(normalized_time) AS best_sum,
+                SUM(normalized_time * normalized_time) AS best_sum_squares
+            FROM ranked
+            WHERE lap_rank <= MAX(3, MIN(20, lap_count / 10))
+            GROUP BY driver_name, session_type
+        """, _NORMALIZATION_PARAMS)
+
+        return [
+            {
+                'driver_name': row[0],
+                'session_type': row[1],
+                'lap_count': row[2],
+                'average_pace': row[3],
+                'best_lap': row[4],
+                'best_count': row[5],
+                'best_sum': row[6],
+                'best_sum_squares': row[7],
+            }
+            for row in cursor
+        ]
 
-def get_session_total_laps(session_key: int) -> int:
+
+def get_driver_info() -> Dict[str, Dict]:
     """
-    Gets the maximum lap number in a session (for fuel calculations).
+    Fetches one metadata row (team, color, acronym) per driver.
+
+    The drivers table stores one row per driver per session, so driver
+    metadata used to ride along on every aggregate row - and whichever
+    row happened to come first decided which team was shown for a
+    driver who switched teams mid-season. This reads the dimension once
+    instead, keeping each driver's values from their most recent
+    session, so repeating those strings through the big lap and
+    aggregate queries is no longer necessary.
+
+    Returns:
+        Dictionary mapping driver name to their metadata
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute(
-            "SELECT MAX(lap_number) as max_lap FROM laps WHERE session_key = ?",
-            (session_key,)
-        )
-        result = cursor.fetchone()
-        return result['max_lap'] if result['max_lap'] else 58
+        cursor.row_factory = None
+
+        # With exactly one MAX() aggregate in the SELECT, SQLite keeps
+        # the other bare columns from the row that produced the maximum
+        # - here, the driver's most recent session.
+        cursor.execute("""
+            SELECT d.full_name, d.team_name, d.team_color, d.name_acronym,
+                   MAX(s.date_start)
+            FROM drivers d
+            JOIN sessions s ON d.session_key = s.session_key
+            GROUP BY d.full_name
+        """)
+
+        return {
+            row[0]: {
+                'team_name': row[1],
+                'team_color': row[2],
+                'name_acronym': row[3],
+            }
+            for row in cursor
+        }
 
 
 # =============================================================================
@@ -239,123 +435,100 @@ def calculate_driver_pace_scores() -> Dict:
     Calculates normalized pace scores for each driver.
 
     For each driver, we:
-    1. Get all their valid laps
-    2. Normalize each lap time
-    3. Take the best N laps (to represent their peak pace)
-    4. Weight by session type
-    5. Calculate an overall pace score
+    1. Get their per-session-type best-lap aggregates (computed in SQL)
+    2. Weight each session type's best laps
+    3. Calculate an overall pace score
+
+    The database has already normalized every lap, sorted each
+    (driver, session type) group, and kept only the best 10% (min 3,
+    max 20), so this function works on a handful of aggregate rows per
+    driver instead of the full lap list.
 
     Returns:
         Dictionary with driver pace data
     """
     print("Calculating driver pace scores...")
 
-    # Get all valid laps
-    all_laps = get_all_valid_laps()
-    print(f"  Processing {len(all_laps)} valid laps...")
+    session_stats = get_driver_session_stats()
 
-    if not all_laps:
+    if not session_stats:
         return {}
 
-    # Cache for session total laps
-    session_totals = {}
+    print(f"  Processing {sum(row['lap_count'] for row in session_stats)} valid laps...")
 
-    # Normalize all lap times
-    for lap in all_laps:
-        session_key = lap['session_key']
-
-        # Get total laps for this session (cached)
-        if session_key not in session_totals:
-            session_totals[session_key] = get_session_total_laps(session_key)
-
-        lap['normalized_time'] = normalize_lap_time(
-            raw_lap_time=lap['lap_duration'],
-            compound=lap['compound'],
-            tire_age=lap['tire_age'],
-            session_type=lap['session_type'],
-            lap_number=lap['lap_number'],
-            total_laps=session_totals[session_key]
-        )
+    # One metadata row per driver, from their most recent session
+    driver_info = get_driver_info()
 
-    # Group laps by driver
-    driver_laps = defaultdict(list)
-    for lap in all_laps:
-        if lap['normalized_time'] is not None:
-            driver_laps[lap['driver_name']].append(lap)
+    # Group the aggregate rows by driver
+    driver_rows = defaultdict(list)
+    for row in session_stats:
+        driver_rows[row['driver_name']].append(row)
 
     # Calculate pace score for each driver
     driver_scores = {}
 
-    for driver_name, laps in driver_laps.items():
-        if not laps:
-            continue
-
-        # Get driver info from first lap
-        first_lap = laps[0]
-        team_name = first_lap['team_name']
-        team_color = first_lap['team_color']
-        name_acronym = first_lap['name_acronym']
-
-        # Group laps by session type for weighted scoring
-        session_laps = defaultdict(list)
-        for lap in laps:
-            session_laps[lap['session_type']].append(lap['normalized_time'])
-
-        # Calculate weighted pace score
-        # We use the best 10% of laps from each session type
-        weighted_times = []
+    for driver_name, rows in driver_rows.items():
         session_details = {}
 
-        for session_type, times in session_laps.items():
-            if not times:
-                continue
-
-            # Sort times (fastest first)
-            sorted_times = sorted(times)
-
-            # Take best 10% of laps (minimum 3, maximum 20)
-            num_best = max(3, min(20, len(sorted_times) // 10))
-            best_times = sorted_times[:num_best]
+        # Running totals across session types. The weighted average is
+        # built from each session type's sum of best laps, and the
+        # consistency (sample standard deviation of all best laps) from
+        # the sums and sums of squares - no per-lap work needed.
+        weighted_sum = 0.0
+        total_weight = 0.0
+        best_count = 0
+        best_sum = 0.0
+        best_sum_squares = 0.0
+        total_laps = 0
+        best_normalized_lap = None
 
+        for row in rows:
             # Get session weight
-            weight = SESSION_WEIGHTS.get(session_type, 0.5)
-
-            # Calculate average of best times
-            avg_best = mean(best_times)
+            weight = SESSION_WEIGHTS.get(row['session_type'], 0.5)
 
             # Store session details
-            session_details[session_type] = {
-                'average_pace': avg_best,
-                'best_lap': min(times),
-                'lap_count': len(times),
+            session_details[row['session_type']] = {
+                'average_pace': row['average_pace'],
+                'best_lap': row['best_lap'],
+                'lap_count': row['lap_count'],
                 'weight': weight,
             }
 
-            # Add weighted times
-            for t in best_times:
-                weighted_times.append((t, weight))
+            weighted_sum += row['best_sum'] * weight
+            total_weight += row['best_count'] * weight
+            best_count += row['best_count']
+            best_sum += row['best_sum']
+            best_sum_squares += row['best_sum_squares']
+            total_laps += row['lap_count']
 
-        if not weighted_times:
-            continue
+            if best_normalized_lap is None or row['best_lap'] < best_normalized_lap:
+                best_normalized_lap = row['best_lap']
 
         # Calculate weighted average pace
-        total_weight = sum(w for _, w in weighted_times)
-        weighted_avg = sum(t * w for t, w in weighted_times) / total_weight
+        weighted_avg = weighted_sum / total_weight
 
         # Calculate consistency (standard deviation of best laps)
-        all_best_times = [t for t, _ in weighted_times]
-        consistency = stdev(all_best_times) if len(all_best_times) > 1 else 0
+        if best_count > 1:
+            variance = (
+                (best_sum_squares - best_sum * best_sum / best_count)
+                / (best_count - 1)
+            )
+            consistency = math.sqrt(max(variance, 0.0))
+        else:
+            consistency = 0
+
+        info = driver_info.get(driver_name, {})
 
         driver_scores[driver_name] = {
             'driver_name': driver_name,
-            'team_name': team_name,
-            'team_color': team_color or '#888888',
-            'name_acronym': name_acronym,
+            'team_name': info.get('team_name'),
+            'team_color': info.get('team_color') or '#888888',
+            'name_acronym': info.get('name_acronym'),
             'pace_score': weighted_avg,
             'consistency': consistency,
-            'total_laps': len(laps),
+            'total_laps': total_laps,
             'session_details': session_details,
-            'best_normalized_lap': min(lap['normalized_time'] for lap in laps),
+            'best_normalized_lap': best_normalized_lap,
         }
 
     return driver_scores
@@ -392,7 +565,7 @@ def calculate_team_pace_scores(driver_scores: Dict) -> Dict:
         best_driver = min(drivers, key=lambda d: d['pace_score'])
 
         # Also calculate team average
-        team_avg = mean(d['pace_score'] for d in drivers)
+        team_avg = fmean(d['pace_score'] for d in drivers)
 
         # Get team color from drivers
         team_color = drivers[0]['team_color'] or '#888888'
@@ -463,14 +636,20 @@ def calculate_rankings() -> Tuple[List[Dict], List[Dict]]:
     return driver_rankings, team_rankings
 
 
-def get_meeting_breakdown() -> List[Dict]:
+def get_meeting_breakdown(top_n: Optional[int] = None) -> List[Dict]:
     """
     Gets pace breakdown by race weekend (meeting).
 
+    Args:
+        top_n: When set, only the first top_n drivers of each meeting
+            are kept (positions and gaps are assigned first, so the
+            leader's gap baseline is unaffected). Callers that render
+            a summary card don't need the full field.
+
     Returns:
         List of meetings with driver pace data for each
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
 
         # Get all meetings
@@ -479,7 +658,7 @@ def get_meeting_breakdown() -> List[Dict]:
             FROM meetings
             ORDER BY date_start DESC
         """)
-        meetings = [dict(row) for row in cursor.fetchall()]
+        meetings = [dict(row) for row in cursor]
 
     # Get laps for each meeting
     all_laps = get_all_valid_laps()
@@ -499,28 +678,23 @@ def get_meeting_breakdown() -> List[Dict]:
         driver_info = {}
 
         for lap in laps:
-            # Simple normalization for meeting view
-            normalized = normalize_lap_time(
-                lap['lap_duration'],
-                lap['compound'],
-                lap['tire_age'],
-                lap['session_type'],
-                lap['lap_number'],
-            )
-            if normalized:
-                driver_times[lap['driver_name']].append(normalized)
-                driver_info[lap['driver_name']] = {
-                    'team_name': lap['team_name'],
-                    'team_color': lap['team_color'],
-                    'name_acronym': lap['name_acronym'],
-                }
+            # The laps arrive already normalized by the SQL query - the
+            # breakdown reuses that instead of re-running the
+            # normalization math a second time per lap
+            driver_times[lap['driver_name']].append(lap['normalized_time'])
+            driver_info[lap['driver_name']] = {
+                'team_name': lap['team_name'],
+                'team_color': lap['team_color'],
+                'name_acronym': lap['name_acronym'],
+            }
 
         # Calculate best pace for each driver
         driver_paces = []
         for driver_name, times in driver_times.items():
-            sorted_times = sorted(times)
-            best_times = sorted_times[:max(3, len(sorted_times) // 10)]
-            avg_pace = mean(best_times)
+            # Only the handful of fastest laps matter, so pick them with
+            # a bounded heap instead of fully sorting the whole list
+            best_times = heapq.nsmallest(max(3, len(times) // 10), times)
+            avg_pace = fmean(best_times)
 
             info = driver_info[driver_name]
             driver_paces.append({
@@ -532,10 +706,15 @@ def get_meeting_breakdown() -> List[Dict]:
                 'lap_count': len(times),
             })
 
-        # Sort by pace
-        driver_paces.sort(key=lambda d: d['pace'])
+        # Sort by pace. When only the top of the field is wanted, a
+        # bounded heap selection skips sorting the rest entirely.
+        if top_n is not None:
+            driver_paces = heapq.nsmallest(top_n, driver_paces, key=lambda d: d['pace'])
+        else:
+            driver_paces.sort(key=lambda d: d['pace'])
 
-        # Add gaps
+        # Add gaps (the overall leader heads the list either way, so
+        # the gap baseline is the same with or without top_n)
         if driver_paces:
             leader_pace = driver_paces[0]['pace']
             for i, d in enumerate(driver_paces):
@@ -547,11 +726,301 @@ def get_meeting_breakdown() -> List[Dict]:
     return meetings
 
 
+# =============================================================================
+# MATERIALIZED RANKINGS
+# =============================================================================
+
+# The full ranking calculation reads every valid lap in the database, which
+# is wasteful to repeat on every page view when the underlying data only
+# changes during ingestion. These functions store the finished results in
+# the rankings_cache table so the website can read them back directly.
+#
+# A fingerprint of the laps table is stored alongside the results, so a
+# stale materialization (e.g. the collector added laps but crashed before
+# refreshing) is detected and recomputed instead of served forever.
+
+def _laps_fingerprint() -> str:
+    """
+    Returns a cheap fingerprint of the laps table.
+
+    Any ingest changes at least one of the row count, the highest
+    session_key, or the highest rowid, so comparing fingerprints tells
+    us whether materialized rankings still match the underlying data
+    without re-reading any laps.
+    """
+    with get_read_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT COUNT(*), IFNULL(MAX(session_key), 0), IFNULL(MAX(id), 0)
+                FROM laps
+            """)
+        except sqlite3.OperationalError:
+            # Table doesn't exist yet
+            return '0-0-0'
+        row = cursor.fetchone()
+        return f"{row[0]}-{row[1]}-{row[2]}"
+
+
+def _materialized_is_fresh() -> bool:
+    """
+    Checks whether the stored rankings were computed from the current
+    laps table (by comparing the fingerprint saved with them).
+    """
+    return load_rankings_payload('laps_fingerprint') == _laps_fingerprint()
+
+
+def refresh_materialized_rankings() -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """
+    Recomputes the global rankings and meeting breakdown, then stores them
+    in the rankings_cache table.
+
+    The data collector calls this at the end of each ingest so the website
+    always has precomputed results to serve.
+
+    Returns:
+        Tuple of (driver_rankings, team_rankings, meetings) - the freshly
+        computed results, so callers that just refreshed can serve them
+        directly instead of reading them back from the cache table
+    """
+    print("\nRefreshing materialized rankings...")
+
+    # Fingerprint first, so data arriving mid-calculation makes the
+    # stored results look stale rather than silently current
+    fingerprint = _laps_fingerprint()
+
+    driver_rankings, team_rankings = calculate_rankings()
+    save_rankings_payload('rankings', json.dumps({
+        'drivers': driver_rankings,
+        'teams': team_rankings,
+    }))
+
+    meetings = get_meeting_breakdown()
+    save_rankings_payload('meeting_breakdown', json.dumps(meetings))
+
+    save_rankings_payload('laps_fingerprint', fingerprint)
+
+    print("Materialized rankings refreshed.")
+
+    return driver_rankings, team_rankings, meetings
+
+
+def ensure_materialized_rankings():
+    """
+    Refreshes the materialized rankings only when they are missing or no
+    longer match the laps table.
+
+    The collector calls this after a run that fetched nothing, so such
+    reruns skip the whole aggregation instead of redoing it. Runs that
+    did ingest data refresh unconditionally - upserts can change rows
+    in place, which the fingerprint cannot detect.
+    """
+    if load_rankings_payload('rankings') and _materialized_is_fresh():
+        print("\nMaterialized rankings already current - skipping refresh.")
+        return
+
+    refresh_materialized_rankings()
+
+
+def get_rankings() -> Tuple[List[Dict], List[Dict]]:
+    """
+    Returns (driver_rankings, team_rankings), preferring the materialized
+    copy stored by the collector.
+
+    Falls back to a live calculation (and stores the result) if nothing
+    has been materialized yet, or if the stored results no longer match
+    the laps table.
+    """
+    payload = load_rankings_payload('rankings')
+    if payload and _materialized_is_fresh():
+        data = json.loads(payload)
+        return data['drivers'], data['teams']
+
+    # Nothing materialized yet (or it's stale) - refresh everything now
+    # and serve the freshly computed results directly. Reading them back
+    # through load_rankings_payload would not work under the in-memory
+    # replica, whose snapshot never sees writes made after startup.
+    driver_rankings, team_rankings, _ = refresh_materialized_rankings()
+    return driver_rankings, team_rankings
+
+
+def get_meeting_breakdown_cached() -> List[Dict]:
+    """
+    Returns the per-meeting pace breakdown, preferring the materialized
+    copy stored by the collector (when it's still fresh).
+    """
+    payload = load_rankings_payload('meeting_breakdown')
+    if payload and _materialized_is_fresh():
+        return json.loads(payload)
+
+    # Serve the freshly computed breakdown directly (see get_rankings)
+    _, _, meetings = refresh_materialized_rankings()
+    return meetings
+
+
 # =============================================================================
 # SESSION-LEVEL PACE ANALYSIS
 # =============================================================================
 
+def _session_driver_stats(cursor, scope_sql: str, params: Dict) -> List[Dict]:
+    """
+    Runs the per-driver aggregate query behind the session views.
+
+    For every driver in scope, SQLite computes in one pass: the best
+    normalized lap (plus that lap's raw time and compound, picked out
+    via the lap_rank = 1 rows), the best individual sectors, the top
+    speed-trap reading, the valid lap count, and the distinct compounds
+    used. Python used to derive all of this by looping over every lap
+    of the session; now it just receives one finished row per driver.
+
+    Args:
+        cursor: Cursor to run the query on
+        scope_sql: WHERE fragment choosing the sessions (e.g. a single
+            session_key, or every session of a meeting)
+        params: Named bindings used by scope_sql
+    """
+    cursor.row_factory = None
+
+    cursor.execute(f"""
+        WITH normalized AS (
+            SELECT
+                l.session_key,
+                l.lap_duration,
+                l.sector_1_duration,
+                l.sector_2_duration,
+                l.sector_3_duration,
+                l.speed_trap,
+                l.compound,
+                d.full_name AS driver_name,
+                d.team_name,
+                d.team_color,
+                d.name_acronym,
+                {_NORMALIZED_TIME_SQL}
+                AS normalized_time
+            FROM laps l
+            JOIN sessions s ON l.session_key = s.session_key
+            JOIN drivers d ON l.driver_number = d.driver_number AND l.session_key = d.session_key
+            WHERE {scope_sql}
+            AND l.is_valid_for_ranking = 1
+            AND l.lap_duration IS NOT NULL
+        ),
+        ranked AS (
+            SELECT
+                *,
+                ROW_NUMBER() OVER (
+                    PARTITION BY session_key, driver_name
+                    ORDER BY normalized_time
+                ) AS lap_rank
+            FROM normalized
+        )
+        SELECT
+            session_key,
+            driver_name,
+            team_name,
+            team_color,
+            name_acronym,
+            MIN(normalized_time) AS normalized_time,
+            MAX(CASE WHEN lap_rank = 1 THEN lap_duration END) AS best_lap,
+            MAX(CASE WHEN lap_rank = 1 THEN compound END) AS best_lap_compound,
+            MIN(sector_1_duration) AS sector_1,
+            MIN(sector_2_duration) AS sector_2,
+            MIN(sector_3_duration) AS sector_3,
+            MAX(speed_trap) AS max_speed,
+            COUNT(*) AS lap_count,
+            GROUP_CONCAT(DISTINCT compound) AS compounds_used
+        FROM ranked
+        GROUP BY session_key, driver_name
+    """, {**_NORMALIZATION_PARAMS, **params})
+
+    return [
+        {
+            'session_key': row[0],
+            'driver_name': row[1],
+            'team_name': row[2],
+            'team_color': row[3],
+            'name_acronym': row[4],
+            'normalized_time': row[5],
+            'best_lap': row[6],
+            'compound': row[7],
+            'sector_1': row[8],
+            'sector_2': row[9],
+            'sector_3': row[10],
+            'max_speed': row[11],
+            'lap_count': row[12],
+            'compounds_used': row[13].split(',') if row[13] else [],
+        }
+        for row in cursor
+    ]
+
+
+def _build_driver_rankings(driver_rows: List[Dict]) -> List[Dict]:
+    """
+    Turns per-driver aggregate rows into a sorted ranking list with
+    positions and gaps to the leader.
+    """
+    driver_rankings = [
+        {
+            'driver_name': row['driver_name'],
+            'name_acronym': row['name_acronym'],
+            'team_name': row['team_name'],
+            'team_color': row['team_color'] or '#888888',
+            'best_lap': row['best_lap'],
+            'normalized_time': row['normalized_time'],
+            'sector_1': row['sector_1'],
+            'sector_2': row['sector_2'],
+            'sector_3': row['sector_3'],
+            'compound': row['compound'],
+            'lap_count': row['lap_count'],
+            'max_speed': row['max_speed'],
+            'compounds_used': row['compounds_used'],
+        }
+        for row in driver_rows
+    ]
+
+    # Sort by normalized time
+    driver_rankings.sort(key=lambda d: d['normalized_time'])
+
+    # Add position and gap
+    if driver_rankings:
+        leader_time = driver_rankings[0]['normalized_time']
+        for i, driver in enumerate(driver_rankings):
+            driver['position'] = i + 1
+            driver['gap_to_leader'] = driver['normalized_time'] - leader_time
+
+    return driver_rankings
+
+
+# Cache of computed session pecking orders, keyed by session_key.
+# get_meeting_pecking_order asks for every session of a weekend, and the
+# web app then asks for the same sessions individually, so without a
+# cache each one is recomputed from scratch several times. Entries are
+# tied to the laps fingerprint: as soon as new laps are ingested, the
+# whole cache is discarded together.
+_session_order_cache = {}
+_session_order_fingerprint = None
+
+
 def get_session_pecking_order(session_key: int) -> Dict:
+    """
+    Returns the pecking order for a single session, computing it only
+    the first time it's asked for (per state of the laps table).
+
+    Callers treat the result as read-only; all of them do today.
+    """
+    global _session_order_fingerprint
+
+    fingerprint = _laps_fingerprint()
+    if fingerprint != _session_order_fingerprint:
+        _session_order_cache.clear()
+        _session_order_fingerprint = fingerprint
+
+    if session_key not in _session_order_cache:
+        _session_order_cache[session_key] = _calculate_session_pecking_order(session_key)
+
+    return _session_order_cache[session_key]
+
+
+def _calculate_session_pecking_order(session_key: int) -> Dict:
     """
     Calculate pecking order for a single session with detailed stats.
 
@@ -566,7 +1035,7 @@ def get_session_pecking_order(session_key: int) -> Dict:
     Returns:
         Dictionary with session details and driver rankings
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
 
         # Get session info
@@ -584,31 +1053,16 @@ def get_session_pecking_order(session_key: int) -> Dict:
 
         session_info = dict(session_row)
 
-        # Get all valid laps for this session with driver info
-        cursor.execute("""
-            SELECT
-                l.driver_number,
-                l.lap_number,
-                l.lap_duration,
-                l.sector_1_duration,
-                l.sector_2_duration,
-                l.sector_3_duration,
-                l.speed_trap,
-                l.compound,
-                l.tire_age,
-                d.full_name as driver_name,
-                d.team_name,
-                d.team_color,
-                d.name_acronym
-            FROM laps l
-            JOIN drivers d ON l.driver_number = d.driver_number AND l.session_key = d.session_key
-            WHERE l.session_key = ? AND l.is_valid_for_ranking = 1 AND l.lap_duration IS NOT NULL
-            ORDER BY l.driver_number, l.lap_number
-        """, (session_key,))
-
-        laps = [dict(row) for row in cursor.fetchall()]
+        # One aggregate query hands back a single finished row per
+        # driver, instead of every lap of the session for Python to
+        # normalize and reduce one at a time.
+        driver_rows = _session_driver_stats(
+            cursor,
+            "l.session_key = :session_key",
+            {'session_key': session_key},
+        )
 
-    if not laps:
+    if not driver_rows:
         return {
             'session': session_info,
             'driver_rankings': [],
@@ -616,105 +1070,18 @@ def get_session_pecking_order(session_key: int) -> Dict:
             'stats': {'driver_count': 0, 'lap_count': 0}
         }
 
-    # Get total laps for fuel calculation
-    total_laps = max(lap['lap_number'] for lap in laps)
-    session_type = session_info['session_type']
-
-    # Process laps by driver
-    driver_data = defaultdict(lambda: {
-        'laps': [],
-        'best_lap': None,
-        'best_sectors': [None, None, None],
-        'compounds_used': set(),
-        'speed_traps': [],
-    })
-
-    for lap in laps:
-        driver_name = lap['driver_name']
-
-        # Normalize the lap time
-        normalized = normalize_lap_time(
-            raw_lap_time=lap['lap_duration'],
-            compound=lap['compound'],
-            tire_age=lap['tire_age'],
-            session_type=session_type,
-            lap_number=lap['lap_number'],
-            total_laps=total_laps
-        )
-
-        lap['normalized_time'] = normalized
-        driver_data[driver_name]['laps'].append(lap)
-
-        # Track best lap
-        if normalized and (driver_data[driver_name]['best_lap'] is None or
-                          normalized < driver_data[driver_name]['best_lap']['normalized_time']):
-            driver_data[driver_name]['best_lap'] = lap
-
-        # Track best sectors
-        for i, sector_key in enumerate(['sector_1_duration', 'sector_2_duration', 'sector_3_duration']):
-            sector_time = lap[sector_key]
-            if sector_time:
-                current_best = driver_data[driver_name]['best_sectors'][i]
-                if current_best is None or sector_time < current_best:
-                    driver_data[driver_name]['best_sectors'][i] = sector_time
-
-        # Track compounds
-        if lap['compound']:
-            driver_data[driver_name]['compounds_used'].add(lap['compound'])
-
-        # Track speed traps
-        if lap['speed_trap']:
-            driver_data[driver_name]['speed_traps'].append(lap['speed_trap'])
-
-    # Build driver rankings
-    driver_rankings = []
-    for driver_name, data in driver_data.items():
-        if not data['best_lap']:
-            continue
-
-        best_lap = data['best_lap']
-
-        # Get driver info from best lap
-        driver_entry = {
-            'driver_name': driver_name,
-            'name_acronym': best_lap['name_acronym'],
-            'team_name': best_lap['team_name'],
-            'team_color': best_lap['team_color'] or '#888888',
-            'best_lap': best_lap['lap_duration'],
-            'normalized_time': best_lap['normalized_time'],
-            'sector_1': data['best_sectors'][0],
-            'sector_2': data['best_sectors'][1],
-            'sector_3': data['best_sectors'][2],
-            'compound': best_lap['compound'],
-            'lap_count': len(data['laps']),
-            'max_speed': max(data['speed_traps']) if data['speed_traps'] else None,
-            'compounds_used': list(data['compounds_used']),
-        }
-
-        driver_rankings.append(driver_entry)
-
-    # Sort by normalized time
-    driver_rankings.sort(key=lambda d: d['normalized_time'] if d['normalized_time'] else float('inf'))
-
-    # Add position and gap
-    if driver_rankings:
-        leader_time = driver_rankings[0]['normalized_time']
-        for i, driver in enumerate(driver_rankings):
-            driver['position'] = i + 1
-            driver['gap_to_leader'] = driver['normalized_time'] - leader_time if driver['normalized_time'] else None
+    driver_rankings = _build_driver_rankings(driver_rows)
 
     # Calculate tire summary
-    tire_summary = defaultdict(lambda: {'count': 0, 'drivers': set()})
-    for driver_name, data in driver_data.items():
-        for compound in data['compounds_used']:
-            tire_summary[compound]['count'] += 1
-            tire_summary[compound]['drivers'].add(driver_name)
+    tire_summary = defaultdict(int)
+    for row in driver_rows:
+        for compound in row['compounds_used']:
+            tire_summary[compound] += 1
 
     tire_summary_list = [
-        {'compound': compound, 'driver_count': info['count']}
-        for compound, info in tire_summary.items()
+        {'compound': compound, 'driver_count': count}
+        for compound, count in sorted(tire_summary.items())
     ]
-    tire_summary_list.sort(key=lambda x: x['compound'])
 
     return {
         'session': session_info,
@@ -722,7 +1089,7 @@ def get_session_pecking_order(session_key: int) -> Dict:
         'tire_summary': tire_summary_list,
         'stats': {
             'driver_count': len(driver_rankings),
-            'lap_count': len(laps),
+            'lap_count': sum(row['lap_count'] for row in driver_rows),
         }
     }
 
@@ -737,7 +1104,7 @@ def get_meeting_pecking_order(meeting_key: int) -> Dict:
     Returns:
         Dictionary with meeting info, overall rankings, and session summaries
     """
-    with get_db_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.cursor()
 
         # Get meeting info
@@ -760,34 +1127,57 @@ def get_meeting_pecking_order(meeting_key: int) -> Dict:
             WHERE meeting_key = ?
             ORDER BY date_start ASC
         """, (meeting_key,))
-        sessions = [dict(row) for row in cursor.fetchall()]
+        sessions = [dict(row) for row in cursor]
+
+        # One aggregate query covers every session of the weekend, so
+        # the database is scanned once instead of once per session (the
+        # per-driver rows carry their session_key for regrouping below)
+        meeting_rows = _session_driver_stats(
+            cursor,
+            """l.session_key IN (
+                SELECT session_key FROM sessions WHERE meeting_key = :meeting_key
+            )""",
+            {'meeting_key': meeting_key},
+        )
+
+    # Regroup the per-driver aggregate rows by session
+    session_rows = defaultdict(list)
+    for row in meeting_rows:
+        session_rows[row['session_key']].append(row)
 
     # Get session summaries with top 3
     session_summaries = []
-    all_driver_times = defaultdict(list)
+    # Running totals per driver for the overall ranking: weighted sum of
+    # times, total weight, and session count. Accumulating these as the
+    # sessions stream past avoids keeping every (time, weight) pair
+    # around just to sum over it again afterwards.
+    driver_totals = defaultdict(lambda: [0.0, 0.0, 0])
     driver_info = {}
 
     for session in sessions:
-        session_data = get_session_pecking_order(session['session_key'])
-        if session_data and session_data['driver_rankings']:
+        rows = session_rows.get(session['session_key'])
+        if rows:
+            driver_rankings = _build_driver_rankings(rows)
+
             # Get top 3 for preview
-            top_3 = session_data['driver_rankings'][:3]
+            top_3 = driver_rankings[:3]
 
             session_summaries.append({
                 'session_key': session['session_key'],
                 'session_name': session['session_name'],
                 'session_type': session['session_type'],
                 'top_3': top_3,
-                'driver_count': session_data['stats']['driver_count'],
-                'lap_count': session_data['stats']['lap_count'],
+                'driver_count': len(driver_rankings),
+                'lap_count': sum(row['lap_count'] for row in rows),
             })
 
-            # Collect all driver times for overall ranking
-            for driver in session_data['driver_rankings']:
-                all_driver_times[driver['driver_name']].append({
-                    'normalized_time': driver['normalized_time'],
-                    'session_type': session['session_type'],
-                })
+            # Fold each driver's time into their running totals
+            weight = SESSION_WEIGHTS.get(session['session_type'], 0.5)
+            for driver in driver_rankings:
+                totals = driver_totals[driver['driver_name']]
+                totals[0] += driver['normalized_time'] * weight
+                totals[1] += weight
+                totals[2] += 1
                 driver_info[driver['driver_name']] = {
                     'name_acronym': driver['name_acronym'],
                     'team_name': driver['team_name'],
@@ -796,16 +1186,8 @@ def get_meeting_pecking_order(meeting_key: int) -> Dict:
 
     # Calculate overall weekend ranking
     overall_rankings = []
-    for driver_name, times in all_driver_times.items():
-        # Weight times by session type
-        weighted_times = []
-        for t in times:
-            weight = SESSION_WEIGHTS.get(t['session_type'], 0.5)
-            weighted_times.append((t['normalized_time'], weight))
-
-        # Calculate weighted average
-        total_weight = sum(w for _, w in weighted_times)
-        weighted_avg = sum(t * w for t, w in weighted_times) / total_weight if total_weight > 0 else 0
+    for driver_name, (weighted_sum, total_weight, session_count) in driver_totals.items():
+        weighted_avg = weighted_sum / total_weight if total_weight > 0 else 0
 
         info = driver_info[driver_name]
         overall_rankings.append({
@@ -814,7 +1196,7 @@ def get_meeting_pecking_order(meeting_key: int) -> Dict:
             'team_name': info['team_name'],
             'team_color': info['team_color'],
             'pace': weighted_avg,
-            'session_count': len(times),
+            'session_count': session_count,
         })
 
     # Sort by pace
@@ -842,8 +1224,12 @@ def get_meeting_pecking_order(meeting_key: int) -> Dict:
 def print_rankings():
     """
     Prints the rankings to the console in a nice format.
+
+    Reads through get_rankings(), so repeat CLI runs between data
+    collections are served from the materialized results instead of
+    re-running the full pipeline every time.
     """
-    driver_rankings, team_rankings = calculate_rankings()
+    driver_rankings, team_rankings = get_rankings()
 
     if not driver_rankings:
         print("No rankings data available!")
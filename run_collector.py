@@ -10,6 +10,7 @@ USAGE:
     python run_collector.py           # Fetch recent 2025 data (default)
     python run_collector.py --2024    # Fetch 2024 data instead (for testing)
     python run_collector.py --full    # Fetch ALL available 2025 data
+    python run_collector.py --refresh # Re-fetch meetings we already have
     python run_collector.py --help    # Show this help message
 
 The script will:
@@ -105,8 +106,10 @@ def main():
 
     else:
         # Default: fetch recent 2025 data
+        # (--refresh re-fetches meetings that are already in the database)
+        force_refresh = "--refresh" in args
         print("[MODE] Fetching recent 2025 race weekend data\n")
-        fetch_recent_data()
+        fetch_recent_data(force_refresh=force_refresh)
 
     # Print completion message
     print("\n" + "=" * 60)
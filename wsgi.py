@@ -0,0 +1,26 @@
+"""
+F1 Pecking Order - WSGI Entry Point
+
+This file exposes the Flask app to a production WSGI server. The built-in
+Flask development server (python app.py) handles one request at a time,
+which is fine for local testing but serializes visitors behind each
+other's database queries.
+
+For real deployments, run the site under gunicorn instead:
+
+    gunicorn wsgi:application --workers 4 --worker-class gthread \
+        --threads 5 --preload --bind 0.0.0.0:5001
+
+- gthread workers serve multiple requests per worker, so visitors don't
+  queue behind each other's (I/O-bound) SQLite reads
+- --preload loads the app once before forking, so compiled templates and
+  imported modules are shared between workers
+"""
+
+from app import app, initialize_database
+
+# Make sure the database exists before the first request arrives
+initialize_database()
+
+# gunicorn looks for this variable (see command above)
+application = app